@@ -1,7 +1,64 @@
 """ArrayTeX."""
 
-from .api import to_matrix
-from .api import to_tabular
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import List
 
 
-__all__ = ["to_matrix", "to_tabular"]
+if TYPE_CHECKING:  # pragma: no cover
+    from .api import stream_tabular
+    from .api import to_block_matrix
+    from .api import to_matrix
+    from .api import to_tabular
+    from .clipboard import MemoryBackend
+    from .clipboard import PyperclipBackend
+    from .clipboard import configure_clipboard
+    from .display import LatexArray
+    from .parse import from_matrix
+    from .parse import from_tabular
+
+
+# the public API is imported on first access so that the command-line client doesn't
+# pay for importing numpy
+_EXPORTS = {
+    "LatexArray": ".display",
+    "MemoryBackend": ".clipboard",
+    "PyperclipBackend": ".clipboard",
+    "configure_clipboard": ".clipboard",
+    "from_matrix": ".parse",
+    "from_tabular": ".parse",
+    "stream_tabular": ".api",
+    "to_block_matrix": ".api",
+    "to_matrix": ".api",
+    "to_tabular": ".api",
+}
+
+__all__ = [
+    "LatexArray",
+    "MemoryBackend",
+    "PyperclipBackend",
+    "configure_clipboard",
+    "from_matrix",
+    "from_tabular",
+    "stream_tabular",
+    "to_block_matrix",
+    "to_matrix",
+    "to_tabular",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public API members lazily."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the public API alongside the module attributes."""
+    return sorted({*globals(), *__all__})
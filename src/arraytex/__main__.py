@@ -1,11 +1,153 @@
 """Command-line interface."""
+import time
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Optional
+
 import click
 
+from .client import default_socket_path
+from .client import request_render
+from .errors import RenderError
+
+
+_KINDS = ("matrix", "tabular")
 
-@click.command()
+
+@click.group(invoke_without_command=True)
 @click.version_option()
-def main() -> None:
+@click.pass_context
+def main(ctx: click.Context) -> None:
     """ArrayTeX."""
+    if ctx.invoked_subcommand is None:
+        click.echo(ctx.get_help())
+
+
+@main.command()
+@click.argument("path", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--kind", type=click.Choice(_KINDS), default="matrix")
+@click.option("--style", default=None, help="The matrix style, e.g. 'b' or 'p'.")
+@click.option("--num-format", default=None, help="A number format, e.g. '.2f'.")
+@click.option("--scientific-notation", is_flag=True, default=False)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    envvar="ARRAYTEX_SOCKET",
+    default=None,
+    help="Forward the request to a daemon started with `arraytex serve`.",
+)
+def render(
+    path: Path,
+    kind: str,
+    style: Optional[str],
+    num_format: Optional[str],
+    scientific_notation: bool,
+    socket_path: Optional[Path],
+) -> None:
+    """Render the array stored in the .npy file PATH to LaTeX."""
+    options = _render_options(kind, style, num_format, scientific_notation)
+
+    if socket_path is not None:
+        try:
+            click.echo(request_render(socket_path, path, kind, options))
+            return
+        except RenderError as exc:
+            raise click.ClickException(str(exc)) from exc
+        except OSError as exc:
+            click.echo(
+                f"ArrayTeX: daemon unavailable ({exc}), rendering here", err=True
+            )
+
+    # imported here so that forwarding to the daemon doesn't pay for importing numpy
+    from .files import render_file
+
+    click.echo(render_file(path, kind, options))
+
+
+@main.command()
+@click.argument(
+    "directory", type=click.Path(exists=True, file_okay=False, path_type=Path)
+)
+@click.option("--kind", type=click.Choice(_KINDS), default="matrix")
+@click.option("--style", default=None, help="The matrix style, e.g. 'b' or 'p'.")
+@click.option("--num-format", default=None, help="A number format, e.g. '.2f'.")
+@click.option("--scientific-notation", is_flag=True, default=False)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0),
+    default=1.0,
+    show_default=True,
+    help="The number of seconds between scans of DIRECTORY.",
+)
+@click.option("--once", is_flag=True, default=False, help="Scan once and exit.")
+def watch(
+    directory: Path,
+    kind: str,
+    style: Optional[str],
+    num_format: Optional[str],
+    scientific_notation: bool,
+    interval: float,
+    once: bool,
+) -> None:
+    """Render each .npy file in DIRECTORY to a .tex file whenever it changes."""
+    options = _render_options(kind, style, num_format, scientific_notation)
+
+    from .files import render_dir
+
+    def report_error(path: Path, exc: Exception) -> None:
+        click.echo(f"ArrayTeX: could not render {path}: {exc}", err=True)
+
+    while True:
+        for output_path in render_dir(directory, kind, options, report_error):
+            click.echo(f"ArrayTeX: wrote {output_path}", err=True)
+
+        if once:
+            return
+
+        try:
+            time.sleep(interval)
+        except KeyboardInterrupt:
+            return
+
+
+@main.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    envvar="ARRAYTEX_SOCKET",
+    default=default_socket_path,
+    show_default="$XDG_RUNTIME_DIR/arraytex-$USER.sock",
+)
+def serve(socket_path: Path) -> None:
+    """Serve render requests on a Unix socket, keeping numpy and caches warm."""
+    from .server import serve as serve_forever
+
+    click.echo(f"ArrayTeX: serving on {socket_path}", err=True)
+    serve_forever(socket_path)
+
+
+def _render_options(
+    kind: str,
+    style: Optional[str],
+    num_format: Optional[str],
+    scientific_notation: bool,
+) -> Dict[str, Any]:
+    """Keyword arguments for `to_matrix` or `to_tabular` from the command options."""
+    if style is not None and kind != "matrix":
+        raise click.UsageError("--style only applies to --kind matrix")
+
+    options: Dict[str, Any] = {}
+    if style is not None:
+        options["style"] = style
+    if num_format is not None:
+        options["num_format"] = num_format
+    if scientific_notation:
+        options["scientific_notation"] = True
+
+    return options
 
 
 if __name__ == "__main__":
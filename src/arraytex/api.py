@@ -1,14 +1,31 @@
 """Main package API."""
 
+import itertools
 from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Mapping
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Union
 
+import numpy as np
+from numpy.typing import ArrayLike
 from numpy.typing import NDArray
 
 from .errors import DimensionMismatchError
+from .errors import OutputTooLargeError
 from .errors import TooManyDimensionsError
+from .utils import _as_stack
+from .utils import _escape_header
+from .utils import _escape_labels
+from .utils import _estimate_column_size
+from .utils import _estimate_size
+from .utils import _parse_batches
+from .utils import _parse_columns
 from .utils import _parse_lines
 from .utils import use_clipboard
 
@@ -19,10 +36,17 @@ def to_matrix(
     style: str = "b",
     num_format: Optional[str] = None,
     scientific_notation: bool = False,
+    batch_axis: int = 0,
+    separator: Optional[str] = None,
+    max_bytes: Optional[int] = None,
     to_clp: bool = False,  # noqa: ARG001
-) -> str:
+) -> Union[str, List[str]]:
     """Convert a numpy.NDArray to LaTeX matrix.
 
+    Arrays with more than 2 dimensions are treated as a stack of matrices along
+    `batch_axis`, any other leading axes are flattened into the stack. The whole stack
+    is formatted in a single pass.
+
     Args:
         arr: the array to be converted
         style: a style formatter string, such as "b" for "bmatrix" or "p" for "pmatrix"
@@ -30,19 +54,48 @@ def to_matrix(
         scientific_notation: a flag to determine whether e.g. 1 x 10^3 format should
             be used if ".e" is used for `num_format`, otherwise e-notation (1e3)
             is used
+        batch_axis: the axis to treat as the batch axis for arrays with more than 2
+            dimensions
+        separator: for arrays with more than 2 dimensions, join the matrices with
+            this separator and return a single string rather than a list
+        max_bytes: an optional budget for the size of the output, checked against an
+            estimate before any formatting is done
         to_clp: copy the output to the system clipboard
 
     Returns:
-        the LaTeX matrix string representation of the array
+        the LaTeX matrix string representation of the array, or a list of
+        representations for arrays with more than 2 dimensions if no `separator` is
+        given
 
     Raises:
-        TooManyDimensionsError: when the supplied array has more than 2 dimensions
+        OutputTooLargeError: when the estimated output size exceeds `max_bytes`
     """
+    if max_bytes is not None:
+        environment = f"{style}matrix"
+        wrapper_bytes = len(f"\\begin{{{environment}}}\n\\end{{{environment}}}")
+        _check_size(
+            arr,
+            num_format,
+            scientific_notation,
+            max_bytes,
+            wrapper_bytes,
+            separator,
+            batch_axis,
+        )
+
     if len(arr.shape) > 2:
-        raise TooManyDimensionsError
+        batches = _parse_batches(
+            _as_stack(arr, batch_axis), num_format, scientific_notation
+        )
+        matrices = [_build_matrix(lines, style) for lines in batches]
+        return matrices if separator is None else separator.join(matrices)
 
     lines = _parse_lines(arr, num_format, scientific_notation)
 
+    return _build_matrix(lines, style)
+
+
+def _build_matrix(lines: List[str], style: str) -> str:
     environment = f"{style}matrix"
 
     rv = [f"\\begin{{{environment}}}"]
@@ -52,52 +105,467 @@ def to_matrix(
     return "\n".join(rv)
 
 
+_NumFormats = Union[str, Sequence[Optional[str]], Mapping[str, str]]
+
+_DELIMITERS = {
+    "": ("", ""),
+    "b": ("[", "]"),
+    "p": ("(", ")"),
+    "v": ("|", "|"),
+    "V": ("\\|", "\\|"),
+    "B": ("\\{", "\\}"),
+}
+
+
 @use_clipboard
-def to_tabular(
-    arr: NDArray[Any],
+def to_block_matrix(
+    blocks: Sequence[Sequence[NDArray[Any]]],
+    style: str = "b",
     num_format: Optional[str] = None,
     scientific_notation: bool = False,
+    col_align: str = "c",
+    max_bytes: Optional[int] = None,
+    to_clp: bool = False,  # noqa: ARG001
+) -> str:
+    r"""Convert a nested list of numpy.NDArray blocks to a LaTeX block matrix.
+
+    Each block is formatted separately, so the combined matrix is never allocated.
+    Blocks are separated by `|` column rules and `\hline` row separators.
+
+    Args:
+        blocks: a nested list of arrays, e.g. `[[A, B], [C, D]]`, as would be passed
+            to `numpy.block`
+        style: a style formatter string for the delimiters, such as "b" for brackets
+            or "p" for parentheses, or "" for no delimiters
+        num_format: a number formatter string, e.g. ".2f"
+        scientific_notation: a flag to determine whether e.g. 1 x 10^3 format should
+            be used if ".e" is used for `num_format`, otherwise e-notation (1e3)
+            is used
+        col_align: the alignment of the columns, usually "c", "r" or "l"
+        max_bytes: an optional budget for the size of the output, checked against an
+            estimate before any formatting is done
+        to_clp: copy the output to the system clipboard
+
+    Returns:
+        the LaTeX block matrix string representation of the blocks
+
+    Raises:
+        ValueError: when an unknown `style` is supplied
+        TooManyDimensionsError: when a block has more than 2 dimensions
+        DimensionMismatchError: when the blocks don't line up into a matrix, or a
+            block's cells format to more than one line each
+        OutputTooLargeError: when the estimated output size exceeds `max_bytes`
+    """
+    if style not in _DELIMITERS:
+        raise ValueError(
+            f"Unknown `style` {style!r}, expected one of {list(_DELIMITERS)}"
+        )
+
+    if not blocks or not blocks[0]:
+        raise DimensionMismatchError("At least one block must be supplied")
+
+    for row_idx, block_row in enumerate(blocks):
+        for col_idx, block in enumerate(block_row):
+            if np.ndim(block) > 2:
+                raise TooManyDimensionsError(
+                    f"Block ({row_idx}, {col_idx}) must have at most 2 dimensions, "
+                    + f"got {np.ndim(block)}"
+                )
+
+    grid = [[np.atleast_2d(block) for block in block_row] for block_row in blocks]
+    widths = [block.shape[1] for block in grid[0]]
+
+    for row_idx, block_row in enumerate(grid):
+        if len(block_row) != len(widths):
+            raise DimensionMismatchError(
+                f"Number of blocks in row {row_idx} ({len(block_row)}) "
+                + f"doesn't match number of blocks in row 0 ({len(widths)})"
+            )
+
+        for col_idx, block in enumerate(block_row):
+            if block.shape[0] != block_row[0].shape[0]:
+                raise DimensionMismatchError(
+                    f"Number of rows in block ({row_idx}, {col_idx}) "
+                    + f"({block.shape[0]}) doesn't match number of rows in block "
+                    + f"({row_idx}, 0) ({block_row[0].shape[0]})"
+                )
+
+            if block.shape[1] != widths[col_idx]:
+                raise DimensionMismatchError(
+                    f"Number of columns in block ({row_idx}, {col_idx}) "
+                    + f"({block.shape[1]}) doesn't match number of columns in block "
+                    + f"(0, {col_idx}) ({widths[col_idx]})"
+                )
+
+    spec = "|".join(col_align * width for width in widths)
+    left, right = _DELIMITERS[style]
+    left = f"\\left{left}" if left else ""
+    right = f"\\right{right}" if right else ""
+
+    if max_bytes is not None:
+        size = len(f"{left}\\begin{{array}}{{{spec}}}\n\\end{{array}}{right}")
+        n_block_rows = sum(1 for block_row in grid if block_row[0].shape[0])
+        size += max(n_block_rows - 1, 0) * len("\\hline\n")
+        size += sum(
+            _estimate_size(block, num_format, scientific_notation)
+            for block_row in grid
+            for block in block_row
+        )
+        _raise_if_too_large(size, max_bytes)
+
+    rv = [f"{left}\\begin{{array}}{{{spec}}}"]
+    for row_idx, block_row in enumerate(grid):
+        # block rows without any rows contribute neither lines nor a separator
+        if not block_row[0].shape[0]:
+            continue
+
+        if len(rv) > 1:
+            rv += [r"\hline"]
+
+        block_lines = [
+            _block_lines(block, (row_idx, col_idx), num_format, scientific_notation)
+            for col_idx, block in enumerate(block_row)
+            if block.shape[1]
+        ]
+        rv += [
+            " & ".join(line.strip() for line in lines) + r" \\"
+            for lines in zip(*block_lines)
+        ]
+    rv += [f"\\end{{array}}{right}"]
+
+    return "\n".join(rv)
+
+
+def _block_lines(
+    block: NDArray[Any],
+    position: Tuple[int, int],
+    num_format: Optional[str],
+    scientific_notation: bool,
+) -> List[str]:
+    lines = _parse_lines(block, num_format, scientific_notation)
+    if len(lines) != block.shape[0]:
+        raise DimensionMismatchError(
+            f"Block {position} formatted to {len(lines)} lines, "
+            + f"expected {block.shape[0]}"
+        )
+
+    return lines
+
+
+@use_clipboard
+def to_tabular(
+    arr: Union[NDArray[Any], Sequence[ArrayLike], Mapping[str, ArrayLike]],
+    num_format: Optional[_NumFormats] = None,
+    scientific_notation: bool = False,
     col_align: Union[List[str], str] = "c",
     col_names: Optional[List[str]] = None,
     index: Optional[List[str]] = None,
+    batch_axis: int = 0,
+    separator: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+    escape: bool = True,
     to_clp: bool = False,  # noqa: ARG001
-) -> str:
+) -> Union[str, List[str]]:
     """Convert a numpy.NDArray to LaTeX tabular environment.
 
+    Arrays with more than 2 dimensions are treated as a stack of tables along
+    `batch_axis`, any other leading axes are flattened into the stack. The whole stack
+    is formatted in a single pass and every table shares the same `col_names` and
+    `index`.
+
+    Columnar input, i.e. a structured array or a sequence or mapping of 1-D arrays, is
+    formatted column by column, without conversion to a single 2-D or object array.
+
     Args:
-        arr: the array to be converted
-        num_format: a number formatter string, e.g. ".2f"
+        arr: the array to be converted, or columnar input
+        num_format: a number formatter string, e.g. ".2f". For columnar input this can
+            also be a list with a formatter string per column, or a mapping of field
+            name or mapping key to formatter string, columns without a formatter use
+            their default representation
         scientific_notation: a flag to determine whether 1 x 10^3 should be used,
             otherwise e-notation is used (1e3)
         col_align: set the alignment of the columns, usually "c", "r" or "l". If a
             single character is provided then it will be broadcast to all columns. If a
             list is provided then each item will be assigned to each column, list size
             and number of columns must match
-        col_names: an optional list of column names, otherwise generic names will be
-            assigned
+        col_names: an optional list of column names, otherwise the field names of a
+            structured array, the keys of a mapping or generic names will be assigned
         index: an optional table index, i.e. row identifiers
+        batch_axis: the axis to treat as the batch axis for arrays with more than 2
+            dimensions
+        separator: for arrays with more than 2 dimensions, join the tables with this
+            separator and return a single string rather than a list
+        max_bytes: an optional budget for the size of the output, checked against an
+            estimate before any formatting is done
+        escape: escape LaTeX special characters, e.g. `&` or `_`, in `col_names` and
+            `index`. Set to `False` for labels which are already LaTeX
         to_clp: copy the output to the system clipboard
 
     Returns:
-        the LaTeX tabular string representation of the array
+        the LaTeX tabular string representation of the array, or a list of
+        representations for arrays with more than 2 dimensions if no `separator` is
+        given
 
     Raises:
-        TooManyDimensionsError: when the supplied array has more than 2 dimensions
+        TooManyDimensionsError: when a structured array or a column has more than 1
+            dimension, e.g. a subarray field
         DimensionMismatchError: when there is a mismatch between column items and number
-            of columns, or column index items and number of rows
+            of columns, or column index items and number of rows, or columns have
+            different lengths
+        OutputTooLargeError: when the estimated output size exceeds `max_bytes`
+        ValueError: when a list or mapping of `num_format` is supplied for a plain
+            array, a key of a mapping of `num_format` doesn't name a column, or a
+            column has fields of its own
     """
-    n_dims = len(arr.shape)
-
-    if n_dims == 0:
-        n_cols = 1
-    elif n_dims == 1:
-        n_cols = arr.shape[0]
-    elif n_dims == 2:
-        n_cols = arr.shape[1]
+    stack = None
+    columns = _to_columns(arr)
+
+    if columns is not None:
+        n_cols = len(columns)
     else:
-        raise TooManyDimensionsError
+        array = np.asarray(arr)
+        n_dims = len(array.shape)
+
+        if n_dims == 0:
+            n_cols = 1
+        elif n_dims == 1:
+            n_cols = array.shape[0]
+        elif n_dims == 2:
+            n_cols = array.shape[1]
+        else:
+            stack = _as_stack(array, batch_axis)
+            n_cols = stack.shape[2]
+
+    col_align, col_names = _resolve_header(
+        n_cols,
+        col_align,
+        col_names,
+        bool(index),
+        list(columns) if columns is not None else None,
+    )
+
+    if escape:
+        col_names = list(_escape_header(tuple(col_names)))
+        index = _escape_labels(index) if index else index
+
+    if columns is not None:
+        num_formats = _column_formats(num_format, list(columns))
+
+        if max_bytes is not None:
+            n_rows = len(next(iter(columns.values()), []))
+            size = _tabular_wrapper_bytes(col_align, col_names, index)
+            size += n_rows + sum(
+                _estimate_column_size(col, fmt, scientific_notation)
+                for col, fmt in zip(columns.values(), num_formats)
+            )
+            _raise_if_too_large(size, max_bytes)
+
+        lines = _parse_columns(list(columns.values()), num_formats, scientific_notation)
+        return _build_tabular(lines, col_align, col_names, index)
+
+    if num_format is not None and not isinstance(num_format, str):
+        raise ValueError("A list or mapping of `num_format` requires columnar input")
+
+    if max_bytes is not None:
+        wrapper_bytes = _tabular_wrapper_bytes(col_align, col_names, index)
+        _check_size(
+            array,
+            num_format,
+            scientific_notation,
+            max_bytes,
+            wrapper_bytes,
+            separator,
+            batch_axis,
+        )
+
+    if stack is not None:
+        batches = _parse_batches(stack, num_format, scientific_notation)
+        tables = [
+            _build_tabular(lines, col_align, col_names, index) for lines in batches
+        ]
+        return tables if separator is None else separator.join(tables)
+
+    lines = _parse_lines(array, num_format, scientific_notation)
+
+    return _build_tabular(lines, col_align, col_names, index)
+
+
+def stream_tabular(
+    rows: Iterable[Any],
+    num_format: Optional[_NumFormats] = None,
+    scientific_notation: bool = False,
+    col_align: Union[List[str], str] = "c",
+    col_names: Optional[List[str]] = None,
+    index: Optional[Iterable[str]] = None,
+    batch_size: int = 1024,
+    escape: bool = True,
+) -> Iterator[str]:
+    """Convert an iterable of rows to a LaTeX tabular environment, chunk by chunk.
+
+    Rows are buffered into blocks of `batch_size` rows which are formatted column by
+    column, so iterables of unknown length, such as database cursors or generators,
+    can be converted without being materialised. Items can also be whole batches of
+    rows, as 2-D or structured arrays, which are formatted directly.
+
+    The header is yielded first, then the rows of each block as it is formatted and
+    finally the footer. Joining the chunks gives the same output as `to_tabular` with
+    the same rows as columnar input, whereas `to_tabular` pads the cells of a plain
+    array to a common width.
+
+    Args:
+        rows: an iterable of rows, e.g. tuples, or of batches of rows
+        num_format: a number formatter string, e.g. ".2f", or a list or mapping of
+            formatter strings per column, as for columnar input to `to_tabular`
+        scientific_notation: a flag to determine whether 1 x 10^3 should be used,
+            otherwise e-notation is used (1e3)
+        col_align: set the alignment of the columns, as for `to_tabular`
+        col_names: an optional list of column names, otherwise the field names of
+            structured batches or generic names will be assigned
+        index: an optional iterable of row identifiers, consumed alongside `rows`
+        batch_size: the number of rows to buffer before formatting
+        escape: escape LaTeX special characters, e.g. `&` or `_`, in `col_names` and
+            `index`. Set to `False` for labels which are already LaTeX
+
+    Yields:
+        successive chunks of the LaTeX tabular string
+
+    Raises:
+        DimensionMismatchError: when there is a mismatch between column items and number
+            of columns, or column index items and number of rows. As the output is
+            streamed this may be raised after some chunks have been yielded
+        ValueError: when `rows` is empty and no `col_names` are given, or a key of a
+            mapping of `num_format` doesn't name a column
+        TypeError: when a row is a mapping, e.g. from a dict cursor, or a string
+    """
+    items = iter(rows)
+    first = next(items, None)
+
+    names: Optional[List[str]] = None
+    if first is None:
+        if not col_names:
+            raise ValueError("`col_names` are required when `rows` is empty")
+
+        n_cols = len(col_names)
+    else:
+        batch = _stream_batch(first)
+        names = list(batch) if batch is not None else None
+        n_cols = len(batch) if batch is not None else len(first)
+
+    col_align, col_names = _resolve_header(
+        n_cols, col_align, col_names, index is not None, names
+    )
+    if escape:
+        col_names = list(_escape_header(tuple(col_names)))
+    names = names or [f"Col {i + 1}" for i in range(n_cols)]
+    num_formats = _column_formats(num_format, names)
+    labels = iter(index) if index is not None else None
+
+    yield "\n".join(_tabular_head(col_align, col_names)) + "\n"
 
-    if not index:
+    pending: List[Sequence[Any]] = []
+    n_rows = 0
+    for item in items if first is None else itertools.chain([first], items):
+        batch = _stream_batch(item)
+        if batch is None:
+            pending.append(item)
+            if len(pending) < batch_size:
+                continue
+
+        if pending:
+            columns = _rows_to_columns(pending, n_cols)
+            n_rows += len(pending)
+            pending = []
+            yield _stream_block(
+                columns, num_formats, scientific_notation, labels, escape
+            )
+
+        if batch is not None:
+            if len(batch) != n_cols:
+                raise DimensionMismatchError(
+                    f"Number of batch columns ({len(batch)}) "
+                    + f"doesn't match number of columns ({n_cols})"
+                )
+
+            columns = list(batch.values())
+            n_rows += len(columns[0]) if columns else 0
+            yield _stream_block(
+                columns, num_formats, scientific_notation, labels, escape
+            )
+
+    if pending:
+        columns = _rows_to_columns(pending, n_cols)
+        n_rows += len(pending)
+        yield _stream_block(columns, num_formats, scientific_notation, labels, escape)
+
+    if labels is not None and next(labels, None) is not None:
+        raise DimensionMismatchError(
+            f"Number of `index` items is more than the number of rows ({n_rows})"
+        )
+
+    yield "\n".join(_TABULAR_FOOT)
+
+
+def _stream_batch(item: Any) -> Optional[Dict[str, NDArray[Any]]]:
+    """Split a batch of rows into named columns, `None` if `item` is a single row."""
+    if isinstance(item, (Mapping, str, bytes)):
+        # iterating would give the keys or characters rather than the items
+        raise TypeError(f"Rows must be sequences of items, got {type(item).__name__}")
+
+    if not isinstance(item, np.ndarray):
+        return None
+
+    if item.dtype.names is not None and item.ndim == 1:
+        return _to_columns(item)
+
+    if item.ndim == 2:
+        return {f"Col {j + 1}": item[:, j] for j in range(item.shape[1])}
+
+    return None
+
+
+def _rows_to_columns(rows: List[Sequence[Any]], n_cols: int) -> List[NDArray[Any]]:
+    for row in rows:
+        if len(row) != n_cols:
+            raise DimensionMismatchError(
+                f"Number of row items ({len(row)}) "
+                + f"doesn't match number of columns ({n_cols})"
+            )
+
+    return [np.asarray(col) for col in zip(*rows)]
+
+
+def _stream_block(
+    columns: List[NDArray[Any]],
+    num_formats: List[Optional[str]],
+    scientific_notation: bool,
+    labels: Optional[Iterator[str]] = None,
+    escape: bool = True,
+) -> str:
+    lines = _parse_columns(columns, num_formats, scientific_notation)
+
+    if labels is not None:
+        block_index = list(itertools.islice(labels, len(lines)))
+        if len(block_index) != len(lines):
+            raise DimensionMismatchError(
+                "Number of `index` items is less than the number of rows"
+            )
+
+        if escape:
+            block_index = _escape_labels(block_index)
+
+        lines = [f"{label} & {line}" for label, line in zip(block_index, lines)]
+
+    return "".join(f"{line} \\\\\n" for line in lines)
+
+
+def _resolve_header(
+    n_cols: int,
+    col_align: Union[List[str], str],
+    col_names: Optional[List[str]],
+    has_index: bool,
+    default_names: Optional[List[str]] = None,
+) -> Tuple[List[str], List[str]]:
+    if not has_index:
         if isinstance(col_align, list) and len(col_align) != n_cols:
             raise DimensionMismatchError(
                 f"Number of `col_align` items ({len(col_align)}) "
@@ -111,7 +579,7 @@ def to_tabular(
             )
 
     if (
-        index
+        has_index
         and col_names
         and isinstance(col_align, list)
         and len(col_names) != len(col_align)
@@ -125,32 +593,154 @@ def to_tabular(
         col_align = [col_align for _ in range(n_cols)]
 
     if not col_names:
-        col_names = [f"Col {i + 1}" for i in range(n_cols)]
-
-    lines = _parse_lines(arr, num_format, scientific_notation)
-
-    if index:
-        if len(index) != len(lines):
-            raise DimensionMismatchError(
-                f"Number of `index` items ({len(index)}) "
-                + f"doesn't match number of rows ({len(lines)})"
-            )
+        col_names = default_names or [f"Col {i + 1}" for i in range(n_cols)]
 
+    if has_index:
         if len(col_align) == n_cols:
-            col_align.insert(0, "l")
+            col_align = ["l", *col_align]
 
         if len(col_names) == n_cols:
-            col_names.insert(0, "Index")
+            col_names = ["Index", *col_names]
 
-        for idx, line in enumerate(lines):
-            lines[idx] = f"{index[idx]} & " + line.strip()
+    return col_align, col_names
 
+
+def _tabular_head(col_align: List[str], col_names: List[str]) -> List[str]:
     rv = [f"\\begin{{tabular}}{{{' '.join(col_align)}}}"]
     rv += [r"\toprule"]
     rv += [" & ".join(col_names) + r" \\"]
     rv += [r"\midrule"]
+
+    return rv
+
+
+_TABULAR_FOOT = [r"\bottomrule", r"\end{tabular}"]
+
+
+def _build_tabular(
+    lines: List[str],
+    col_align: List[str],
+    col_names: List[str],
+    index: Optional[List[str]] = None,
+) -> str:
+    if index:
+        if len(index) != len(lines):
+            raise DimensionMismatchError(
+                f"Number of `index` items ({len(index)}) "
+                + f"doesn't match number of rows ({len(lines)})"
+            )
+
+        lines = [f"{label} & " + line.strip() for label, line in zip(index, lines)]
+
+    rv = _tabular_head(col_align, col_names)
     rv += [line.strip() + r" \\" for line in lines]
-    rv += [r"\bottomrule"]
-    rv += [r"\end{tabular}"]
+    rv += _TABULAR_FOOT
 
     return "\n".join(rv)
+
+
+def _to_columns(
+    arr: Union[NDArray[Any], Sequence[ArrayLike], Mapping[str, ArrayLike]],
+) -> Optional[Dict[str, NDArray[Any]]]:
+    """Split columnar input into named 1-D columns, `None` for a plain array."""
+    if isinstance(arr, Mapping):
+        items = [(str(name), col) for name, col in arr.items()]
+    elif isinstance(arr, (list, tuple)):
+        items = [(f"Col {i + 1}", col) for i, col in enumerate(arr)]
+    else:
+        array = np.asarray(arr)
+        if array.dtype.names is None:
+            return None
+
+        if array.ndim > 1:
+            raise TooManyDimensionsError(
+                f"Structured arrays must have at most 1 dimension, got {array.ndim}"
+            )
+
+        array = np.atleast_1d(array)
+        items = [(name, array[name]) for name in array.dtype.names]
+
+    columns = {name: np.atleast_1d(np.asarray(col)) for name, col in items}
+
+    for name, col in columns.items():
+        if col.ndim > 1:
+            raise TooManyDimensionsError(
+                f"Column `{name}` must have at most 1 dimension, got {col.ndim}"
+            )
+
+        if col.dtype.names is not None:
+            raise ValueError(f"Column `{name}` must not have fields")
+
+    lengths = [len(col) for col in columns.values()]
+    if len(set(lengths)) > 1:
+        raise DimensionMismatchError(
+            f"All columns must have the same number of rows, got {lengths}"
+        )
+
+    return columns
+
+
+def _tabular_wrapper_bytes(
+    col_align: List[str],
+    col_names: List[str],
+    index: Optional[List[str]] = None,
+) -> int:
+    size = len(_build_tabular([], col_align, col_names))
+    if index:
+        size += sum(len(f"{label} & ") for label in index)
+
+    return size
+
+
+def _column_formats(
+    num_format: Optional[_NumFormats],
+    names: List[str],
+) -> List[Optional[str]]:
+    if isinstance(num_format, Mapping):
+        unknown = [key for key in num_format if key not in names]
+        if unknown:
+            raise ValueError(
+                f"Unknown `num_format` keys {unknown}, expected some of {names}"
+            )
+
+        return [num_format.get(name) for name in names]
+
+    if num_format is not None and not isinstance(num_format, str):
+        if len(num_format) != len(names):
+            raise DimensionMismatchError(
+                f"Number of `num_format` items ({len(num_format)}) "
+                + f"doesn't match number of columns ({len(names)})"
+            )
+
+        return list(num_format)
+
+    return [num_format for _ in names]
+
+
+def _check_size(
+    arr: NDArray[Any],
+    num_format: Optional[str],
+    scientific_notation: bool,
+    max_bytes: int,
+    wrapper_bytes: int,
+    separator: Optional[str] = None,
+    batch_axis: int = 0,
+) -> None:
+    n_items = 1
+    if len(arr.shape) > 2:
+        arr = _as_stack(arr, batch_axis)
+        n_items = arr.shape[0]
+
+    size = _estimate_size(arr, num_format, scientific_notation)
+    size += n_items * wrapper_bytes
+    size += max(n_items - 1, 0) * len(separator or "")
+
+    _raise_if_too_large(size, max_bytes)
+
+
+def _raise_if_too_large(size: int, max_bytes: int) -> None:
+    if size > max_bytes:
+        raise OutputTooLargeError(
+            f"Estimated output size ({size} bytes) "
+            + f"exceeds `max_bytes` ({max_bytes} bytes)"
+        )
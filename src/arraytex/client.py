@@ -0,0 +1,75 @@
+"""Client for the render daemon.
+
+Only the standard library is imported here so that forwarding a request is cheap.
+"""
+import getpass
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+from .errors import RenderError
+
+
+def default_socket_path() -> Path:
+    """The default location of the render daemon socket.
+
+    Returns:
+        a per-user socket path in the runtime directory, or the temporary directory
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"arraytex-{getpass.getuser()}.sock"
+
+
+def request_render(
+    socket_path: Path,
+    path: Path,
+    kind: str = "matrix",
+    options: Optional[Dict[str, Any]] = None,
+    timeout: float = 60.0,
+) -> str:
+    """Ask a running render daemon to render an array stored in a `.npy` file.
+
+    Args:
+        socket_path: the path to the daemon socket
+        path: the path to the `.npy` file
+        kind: either "matrix" or "tabular"
+        options: keyword arguments for `to_matrix` or `to_tabular`
+        timeout: the number of seconds to wait for the daemon
+
+    Returns:
+        the LaTeX string representation of the array
+
+    Raises:
+        OSError: when the daemon can't be reached, Unix sockets are unavailable, or the
+            daemon closes the connection without a reply
+        RenderError: when the daemon fails to render the array
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        # e.g. on Windows, where the daemon can't be running either
+        raise ConnectionError("Unix sockets are unavailable")
+
+    request = {"path": str(Path(path).resolve()), "kind": kind, "options": options}
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(request).encode() + b"\n")
+
+        with sock.makefile("rb") as response_file:
+            line = response_file.readline()
+
+    try:
+        response = json.loads(line)
+    except ValueError:
+        # e.g. the daemon exited before replying, so it's treated as unreachable
+        raise ConnectionError("The daemon closed the connection early") from None
+
+    if "error" in response:
+        raise RenderError(response["error"])
+
+    return str(response["output"])
@@ -0,0 +1,119 @@
+"""Clipboard backends."""
+import logging
+import threading
+from typing import List
+from typing import Optional
+
+import pyperclip
+from typing_extensions import Protocol
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+
+class ClipboardBackend(Protocol):
+    """Interface for objects capable of copying text to a clipboard."""
+
+    def copy(self, text: str) -> None:
+        """Copy `text` to the clipboard."""
+
+
+class PyperclipBackend:
+    """Copy to the system clipboard using `pyperclip`."""
+
+    def copy(self, text: str) -> None:
+        """Copy `text` to the system clipboard.
+
+        Args:
+            text: the text to be copied
+        """
+        pyperclip.copy(text)
+
+
+class MemoryBackend:
+    """An in-process clipboard, useful for testing."""
+
+    def __init__(self) -> None:
+        """Initialise an empty clipboard."""
+        self.contents: List[str] = []
+
+    def copy(self, text: str) -> None:
+        """Record `text` as the latest clipboard item.
+
+        Args:
+            text: the text to be copied
+        """
+        self.contents.append(text)
+
+    @property
+    def last(self) -> Optional[str]:
+        """The most recently copied text, if any."""
+        return self.contents[-1] if self.contents else None
+
+
+_backend: ClipboardBackend = PyperclipBackend()
+_max_bytes: Optional[int] = DEFAULT_MAX_BYTES
+_background: bool = False
+
+
+def configure_clipboard(
+    backend: Optional[ClipboardBackend] = None,
+    max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+    background: bool = False,
+) -> None:
+    """Configure how outputs are copied to the clipboard.
+
+    Args:
+        backend: the clipboard backend to use, defaults to the system clipboard
+        max_bytes: the maximum size of output that will be copied, `None` to disable
+            the limit
+        background: copy on a background thread rather than blocking the caller
+    """
+    global _backend, _max_bytes, _background
+
+    _backend = backend if backend is not None else PyperclipBackend()
+    _max_bytes = max_bytes
+    _background = background
+
+
+def copy_to_clipboard(text: str) -> Optional[threading.Thread]:
+    """Copy `text` using the configured backend.
+
+    Outputs larger than the configured `max_bytes` are not copied and a warning is
+    logged instead.
+
+    Args:
+        text: the text to be copied
+
+    Returns:
+        the thread performing the copy if copying in the background, otherwise `None`
+    """
+    size = len(text.encode())
+    if _max_bytes is not None and size > _max_bytes:
+        logger.warning(
+            "ArrayTeX: output (%d bytes) exceeds the clipboard limit (%d bytes), "
+            "not copied",
+            size,
+            _max_bytes,
+        )
+        return None
+
+    if _background:
+        thread = threading.Thread(target=_copy, args=(_backend, text), daemon=True)
+        thread.start()
+        return thread
+
+    _copy(_backend, text)
+    return None
+
+
+def _copy(backend: ClipboardBackend, text: str) -> None:
+    try:
+        backend.copy(text)
+    except pyperclip.PyperclipException as exc:
+        logger.warning("ArrayTeX: could not copy to clipboard: %s", exc)
+        return
+
+    logger.info("ArrayTeX: copied to clipboard")
@@ -0,0 +1,278 @@
+"""Lazily rendered arrays for notebook display."""
+import hashlib
+from typing import Any
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+from numpy.typing import NDArray
+
+from .api import _build_matrix
+from .api import _build_tabular
+from .api import _resolve_header
+from .errors import DimensionMismatchError
+from .utils import _as_stack
+from .utils import _escape_header
+from .utils import _escape_labels
+from .utils import _parse_batches
+
+
+_KINDS = ("matrix", "tabular")
+
+_MATRIX_DOTS = (r"\cdots", r"\vdots", r"\ddots")
+_TABULAR_DOTS = (r"$\cdots$", r"$\vdots$", r"$\ddots$")
+
+
+class LatexArray:
+    """An array that renders to LaTeX lazily, e.g. when displayed in a notebook.
+
+    The rendered output is memoized against the render options and a digest of the
+    displayed cells, so re-displaying an unchanged array doesn't format it again, while
+    changes to the options or in-place changes to the array are picked up. Arrays with
+    more than `max_cells` cells are truncated to their first and last `edge_items`
+    rows and columns, with the elided cells replaced by dots.
+
+    Args:
+        arr: the array to be displayed
+        kind: either "matrix" or "tabular", to render with `to_matrix` or
+            `to_tabular`
+        style: a style formatter string for matrices, as for `to_matrix`
+        num_format: a number formatter string, e.g. ".2f"
+        scientific_notation: a flag to determine whether e.g. 1 x 10^3 format should
+            be used if ".e" is used for `num_format`, otherwise e-notation (1e3)
+            is used
+        col_align: the alignment of the columns of a tabular, as for `to_tabular`
+        col_names: an optional list of column names for a tabular
+        index: an optional tabular index, i.e. row identifiers
+        batch_axis: the axis to treat as the batch axis for arrays with more than 2
+            dimensions
+        separator: the separator between matrices or tables of arrays with more than
+            2 dimensions
+        max_cells: the number of cells above which the array is truncated
+        edge_items: the number of leading and trailing items kept along each
+            truncated axis
+        escape: escape LaTeX special characters in `col_names` and `index`
+
+    Raises:
+        ValueError: when an unknown `kind` is supplied
+    """
+
+    def __init__(
+        self,
+        arr: ArrayLike,
+        kind: str = "matrix",
+        style: str = "b",
+        num_format: Optional[str] = None,
+        scientific_notation: bool = False,
+        col_align: Union[List[str], str] = "c",
+        col_names: Optional[List[str]] = None,
+        index: Optional[List[str]] = None,
+        batch_axis: int = 0,
+        separator: str = "\n",
+        max_cells: int = 10_000,
+        edge_items: int = 3,
+        escape: bool = True,
+    ) -> None:
+        """Initialise the wrapper, no rendering is done until the output is needed."""
+        if kind not in _KINDS:
+            raise ValueError(f"Unknown `kind` {kind!r}, expected one of {_KINDS}")
+
+        self.arr = np.asarray(arr)
+        self.kind = kind
+        self.style = style
+        self.num_format = num_format
+        self.scientific_notation = scientific_notation
+        self.col_align = col_align
+        self.col_names = col_names
+        self.index = index
+        self.batch_axis = batch_axis
+        self.separator = separator
+        self.max_cells = max_cells
+        self.edge_items = edge_items
+        self.escape = escape
+
+        self._key: Optional[Hashable] = None
+        self._rendered: Optional[str] = None
+
+    def __repr__(self) -> str:
+        """Summarise the wrapped array without rendering it."""
+        return (
+            f"LatexArray(shape={self.arr.shape}, dtype={self.arr.dtype}, "
+            + f"kind={self.kind!r})"
+        )
+
+    def __str__(self) -> str:
+        """The rendered LaTeX."""
+        return self.render()
+
+    def _repr_latex_(self) -> str:
+        """The rendered LaTeX for display in Jupyter."""
+        out = self.render()
+        return f"$${out}$$" if self.kind == "matrix" else out
+
+    def render(self) -> str:
+        """Render the array, reusing the previous output if the array is unchanged.
+
+        Returns:
+            the LaTeX string representation of the array
+        """
+        stack, splits = self._visible()
+        digest = _digest(stack, splits)
+        key = None if digest is None else (self._options(), digest)
+
+        if self._rendered is None or key is None or key != self._key:
+            self._rendered = self._render(stack, splits)
+            self._key = key
+
+        return self._rendered
+
+    def _options(self) -> Tuple[Any, ...]:
+        """The render options, copied so that later in-place changes are noticed."""
+        options = (
+            self.kind,
+            self.style,
+            self.num_format,
+            self.scientific_notation,
+            self.col_align,
+            self.col_names,
+            self.index,
+            self.batch_axis,
+            self.separator,
+            self.max_cells,
+            self.edge_items,
+            self.escape,
+        )
+        return tuple(tuple(opt) if isinstance(opt, list) else opt for opt in options)
+
+    def _visible(self) -> Tuple[NDArray[Any], Tuple[Optional[int], ...]]:
+        """The visible part of the array as a stack, and where items were elided."""
+        arr = self.arr
+        if arr.ndim > 2:
+            stack = _as_stack(arr, self.batch_axis)
+        else:
+            stack = np.atleast_2d(arr)[np.newaxis]
+
+        if arr.size <= self.max_cells:
+            return stack, (None, None, None)
+
+        splits: List[Optional[int]] = []
+        for axis in range(3):
+            size = stack.shape[axis]
+            if size <= 2 * self.edge_items:
+                splits.append(None)
+                continue
+
+            keep = np.r_[: self.edge_items, size - self.edge_items : size]
+            stack = np.take(stack, keep, axis=axis)
+            splits.append(self.edge_items)
+
+        return stack, tuple(splits)
+
+    def _render(self, stack: NDArray[Any], splits: Tuple[Optional[int], ...]) -> str:
+        batch_split, row_split, col_split = splits
+        hdots, vdots, ddots = _MATRIX_DOTS if self.kind == "matrix" else _TABULAR_DOTS
+
+        batches = _parse_batches(stack, self.num_format, self.scientific_notation)
+        batches = [
+            _insert_dots(lines, row_split, col_split, hdots, vdots, ddots)
+            for lines in batches
+        ]
+
+        if self.kind == "matrix":
+            rendered = [_build_matrix(lines, self.style) for lines in batches]
+        else:
+            rendered = self._build_tables(batches, row_split, col_split)
+
+        if batch_split is not None:
+            rendered.insert(batch_split, hdots)
+
+        return self.separator.join(rendered)
+
+    def _build_tables(
+        self,
+        batches: List[List[str]],
+        row_split: Optional[int],
+        col_split: Optional[int],
+    ) -> List[str]:
+        if self.arr.ndim > 2:
+            n_rows, n_cols = np.moveaxis(self.arr, self.batch_axis, 0).shape[-2:]
+        else:
+            n_rows, n_cols = np.atleast_2d(self.arr).shape
+        col_align, col_names = _resolve_header(
+            n_cols, self.col_align, self.col_names, bool(self.index)
+        )
+        index = self.index
+
+        if index and len(index) != n_rows:
+            raise DimensionMismatchError(
+                f"Number of `index` items ({len(index)}) "
+                + f"doesn't match number of rows ({n_rows})"
+            )
+
+        if col_split is not None:
+            offset = len(col_names) - n_cols
+            col_align = [*col_align[: offset + col_split], "c", *col_align[-col_split:]]
+            col_names = [*col_names[: offset + col_split], *col_names[-col_split:]]
+
+        if row_split is not None and index:
+            index = [*index[:row_split], *index[-row_split:]]
+
+        if self.escape:
+            col_names = list(_escape_header(tuple(col_names)))
+            index = _escape_labels(index) if index else index
+
+        if col_split is not None:
+            col_names.insert(len(col_names) - col_split, _TABULAR_DOTS[0])
+
+        if row_split is not None and index:
+            index.insert(row_split, _TABULAR_DOTS[1])
+
+        return [_build_tabular(lines, col_align, col_names, index) for lines in batches]
+
+
+def _digest(
+    stack: NDArray[Any], splits: Tuple[Optional[int], ...]
+) -> Optional[Hashable]:
+    """A key identifying the contents of `stack`, `None` if it can't be computed."""
+    if stack.dtype.hasobject:
+        return None
+
+    if stack.size == 0:
+        return (stack.shape, stack.dtype.str, splits, None)
+
+    # viewed as bytes, as not all dtypes, e.g. datetimes, support the buffer protocol
+    buffer = np.ascontiguousarray(stack).view(np.uint8).data
+    digest = hashlib.blake2b(buffer).hexdigest()
+
+    return (stack.shape, stack.dtype.str, splits, digest)
+
+
+def _insert_dots(
+    lines: List[str],
+    row_split: Optional[int],
+    col_split: Optional[int],
+    hdots: str,
+    vdots: str,
+    ddots: str,
+) -> List[str]:
+    """Insert dots into formatted lines where rows and columns were elided."""
+    if row_split is None and col_split is None:
+        return lines
+
+    cells = [line.strip().split(" & ") for line in lines]
+
+    if col_split is not None:
+        for row in cells:
+            row.insert(col_split, hdots)
+
+    if row_split is not None:
+        filler = [vdots for _ in cells[0]]
+        if col_split is not None:
+            filler[col_split] = ddots
+        cells.insert(row_split, filler)
+
+    return [" & ".join(row) for row in cells]
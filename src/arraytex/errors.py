@@ -7,3 +7,15 @@ class TooManyDimensionsError(Exception):
 
 class DimensionMismatchError(Exception):
     """Raised when dimensionality issues occur."""
+
+
+class OutputTooLargeError(Exception):
+    """Raised when the estimated output size exceeds the given budget."""
+
+
+class ParseError(Exception):
+    """Raised when LaTeX can't be parsed back into an array."""
+
+
+class RenderError(Exception):
+    """Raised when the render daemon fails to render a request."""
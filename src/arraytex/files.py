@@ -0,0 +1,198 @@
+"""Render arrays stored in files."""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+from .api import to_matrix
+from .api import to_tabular
+
+
+KINDS = ("matrix", "tabular")
+
+MANIFEST_NAME = ".arraytex-manifest.json"
+
+_MANIFEST_VERSION = 1
+
+
+def render_file(
+    path: Path, kind: str = "matrix", options: Optional[Dict[str, Any]] = None
+) -> str:
+    """Render an array stored in a `.npy` file to LaTeX.
+
+    Args:
+        path: the path to the `.npy` file
+        kind: either "matrix" or "tabular", to render with `to_matrix` or
+            `to_tabular`
+        options: keyword arguments for `to_matrix` or `to_tabular`
+
+    Returns:
+        the LaTeX string representation of the array, arrays with more than 2
+        dimensions are separated by blank lines
+
+    Raises:
+        ValueError: when an unknown `kind` is supplied
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown `kind` {kind!r}, expected one of {KINDS}")
+
+    options = {"separator": "\n\n", **(options or {})}
+    arr = np.load(path, allow_pickle=False)
+
+    if kind == "matrix":
+        return str(to_matrix(arr, **options))
+
+    return str(to_tabular(arr, **options))
+
+
+def render_dir(
+    directory: Path,
+    kind: str = "matrix",
+    options: Optional[Dict[str, Any]] = None,
+    on_error: Optional[Callable[[Path, Exception], None]] = None,
+) -> List[Path]:
+    """Render every `.npy` file in a directory to a `.tex` file alongside it.
+
+    A manifest of the modification times, sizes and content hashes of the inputs is
+    kept in the directory, so only arrays which changed since the last call are
+    rendered again. Files whose modification time changed but whose content didn't
+    are not rendered again. Outputs and the manifest are written atomically.
+
+    Args:
+        directory: the directory to search for `.npy` files, recursively
+        kind: either "matrix" or "tabular", to render with `to_matrix` or
+            `to_tabular`
+        options: keyword arguments for `to_matrix` or `to_tabular`, all arrays are
+            rendered again when these change
+        on_error: a callback for arrays which fail to render, which are then retried
+            on the next call, otherwise the error is raised
+
+    Returns:
+        the paths of the `.tex` files written
+
+    Raises:
+        ValueError: when an unknown `kind` is supplied
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown `kind` {kind!r}, expected one of {KINDS}")
+
+    manifest_path = directory / MANIFEST_NAME
+    settings = {"kind": kind, "options": options or {}}
+    previous = _read_manifest(manifest_path, settings)
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    written: List[Path] = []
+
+    for path in sorted(directory.rglob("*.npy")):
+        key = path.relative_to(directory).as_posix()
+        output_path = path.with_suffix(".tex")
+        cached = previous.get(key) if output_path.exists() else None
+
+        try:
+            entry, rendered = _refresh(path, output_path, cached, kind, options)
+        except Exception as exc:
+            # e.g. the file was removed since it was listed, or isn't a valid array
+            if on_error is None:
+                raise
+            on_error(path, exc)
+            continue
+
+        entries[key] = entry
+        if rendered:
+            written.append(output_path)
+
+    if entries != previous:
+        manifest = {"version": _MANIFEST_VERSION, **settings, "files": entries}
+        _write_atomic(manifest_path, json.dumps(manifest, indent=2, sort_keys=True))
+
+    return written
+
+
+def _refresh(
+    path: Path,
+    output_path: Path,
+    cached: Optional[Dict[str, Any]],
+    kind: str,
+    options: Optional[Dict[str, Any]],
+) -> Tuple[Dict[str, Any], bool]:
+    """Render `path` unless its manifest entry shows it's unchanged.
+
+    Returns:
+        the new manifest entry, and whether `path` was rendered
+    """
+    file_stat = path.stat()
+    entry: Dict[str, Any] = {
+        "mtime_ns": file_stat.st_mtime_ns,
+        "size": file_stat.st_size,
+    }
+
+    if cached is not None and all(cached.get(k) == v for k, v in entry.items()):
+        return cached, False
+
+    entry["hash"] = _hash_file(path)
+    if cached is not None and cached.get("hash") == entry["hash"]:
+        return entry, False
+
+    _write_atomic(output_path, render_file(path, kind, options))
+
+    return entry, True
+
+
+def _read_manifest(path: Path, settings: Dict[str, Any]) -> Dict[str, Any]:
+    """The manifest entries, empty if missing or written with other settings."""
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(manifest, dict) or manifest.get("version") != _MANIFEST_VERSION:
+        return {}
+
+    if any(manifest.get(name) != value for name, value in settings.items()):
+        return {}
+
+    files = manifest.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.blake2b()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write `text` to `path` so that readers never see a partially written file."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        # `mkstemp` creates the file readable by the owner only
+        tmp_path.chmod(0o666 & ~_UMASK)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink()
+        raise
+
+
+def _read_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# read once, as it can only be read by setting it, which isn't thread-safe
+_UMASK = _read_umask()
@@ -0,0 +1,113 @@
+"""Parse LaTeX produced by ArrayTeX back into arrays."""
+import warnings
+from typing import Any
+from typing import List
+
+import numpy as np
+from numpy.typing import DTypeLike
+from numpy.typing import NDArray
+
+from .errors import ParseError
+
+
+# applied in order, reducing the body to whitespace separated numbers
+_REPLACEMENTS = [
+    (r" \times 10^{", "e"),
+    (r"\mathrm{e}{", "e"),
+    ("}", ""),
+    ("\\\\", ""),
+    ("&", " "),
+]
+
+
+def from_matrix(text: str, dtype: DTypeLike = float) -> NDArray[Any]:
+    r"""Convert a LaTeX matrix, as produced by `to_matrix`, to a numpy.NDArray.
+
+    Both e-notation (`\mathrm{e}{..}`) and scientific notation (`\times 10^{..}`) are
+    understood. Block matrices from `to_block_matrix` can also be parsed, the blocks
+    are combined into a single array.
+
+    Args:
+        text: the LaTeX matrix string
+        dtype: the dtype of the returned array
+
+    Returns:
+        the parsed 2 dimensional array
+
+    Raises:
+        ParseError: when `text` isn't a matrix in the format produced by `to_matrix`
+    """
+    lines = text.strip().splitlines()
+    if len(lines) < 2 or r"\begin{" not in lines[0] or r"\end{" not in lines[-1]:
+        raise ParseError("Expected a matrix environment")
+
+    rows = [line for line in lines[1:-1] if line.strip() != r"\hline"]
+
+    return _parse_rows(rows, dtype)
+
+
+def from_tabular(
+    text: str, dtype: DTypeLike = float, index: bool = False
+) -> NDArray[Any]:
+    """Convert a LaTeX tabular, as produced by `to_tabular`, to a numpy.NDArray.
+
+    The header is skipped, only the body of the table is parsed.
+
+    Args:
+        text: the LaTeX tabular string
+        dtype: the dtype of the returned array
+        index: whether the table has an index column, which is dropped
+
+    Returns:
+        the parsed 2 dimensional array
+
+    Raises:
+        ParseError: when `text` isn't a tabular in the format produced by
+            `to_tabular`
+    """
+    lines = [line.strip() for line in text.strip().splitlines()]
+
+    try:
+        start = lines.index(r"\midrule") + 1
+        end = lines.index(r"\bottomrule", start)
+    except ValueError:
+        raise ParseError("Expected a tabular environment") from None
+
+    rows = lines[start:end]
+    if index:
+        rows = [row.split(" & ", 1)[-1] for row in rows]
+
+    return _parse_rows(rows, dtype)
+
+
+def _parse_rows(rows: List[str], dtype: DTypeLike) -> NDArray[Any]:
+    """Parse the rows of a body in a single pass into a 2-D array."""
+    if not rows:
+        return np.empty((0, 0), dtype=dtype)
+
+    n_cols = rows[0].count("&") + 1
+
+    # a single count over the body would miss rows which are ragged in opposite ways
+    for row_idx, row in enumerate(rows):
+        if row.count("&") != n_cols - 1:
+            raise ParseError(
+                f"Expected {n_cols} columns in row {row_idx}, "
+                + f"found {row.count('&') + 1}"
+            )
+
+    body = "\n".join(rows)
+    for old, new in _REPLACEMENTS:
+        body = body.replace(old, new)
+
+    with warnings.catch_warnings():
+        # a partial parse is reported through the size check below
+        warnings.simplefilter("ignore", DeprecationWarning)
+        arr = np.fromstring(body, dtype=dtype, sep=" ")
+
+    if arr.size != len(rows) * n_cols:
+        raise ParseError(
+            f"Expected {len(rows)} rows of {n_cols} numbers, "
+            + f"found {arr.size} numbers"
+        )
+
+    return arr.reshape(len(rows), n_cols)
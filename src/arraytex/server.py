@@ -0,0 +1,110 @@
+"""Render daemon, keeping the interpreter and caches warm between renders."""
+import json
+import socket
+import socketserver
+import stat
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from typing import Dict
+
+from .files import render_file
+
+
+class _RenderHandler(socketserver.StreamRequestHandler):
+    """Handle a single JSON encoded render request."""
+
+    def handle(self) -> None:
+        """Render the requested file and reply with the output or the error."""
+        line = self.rfile.readline()
+        if not line:
+            # e.g. another daemon checking whether the socket is in use
+            return
+
+        try:
+            request = json.loads(line)
+            output = _render(
+                request["path"], request.get("kind", "matrix"), request.get("options")
+            )
+            response = {"output": output}
+        except Exception as exc:  # noqa: BLE001
+            # any failure is reported to the client rather than stopping the daemon
+            response = {"error": f"{type(exc).__name__}: {exc}"}
+
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+def make_server(socket_path: Path) -> "socketserver.ThreadingUnixStreamServer":
+    """Create a render server listening on a Unix socket.
+
+    A stale socket left behind by a previous daemon is replaced, but a socket which a
+    running daemon is listening on isn't.
+
+    Args:
+        socket_path: the path to the socket
+
+    Returns:
+        the server, ready to `serve_forever`
+
+    Raises:
+        FileExistsError: when something other than a stale socket exists at
+            `socket_path`
+    """
+    if socket_path.exists():
+        if not stat.S_ISSOCK(socket_path.stat().st_mode):
+            raise FileExistsError(f"{socket_path} exists and isn't a socket")
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(socket_path))
+            except ConnectionRefusedError:
+                # nothing is listening, so it was left behind by a previous daemon
+                socket_path.unlink()
+            else:
+                raise FileExistsError(f"A daemon is already serving on {socket_path}")
+
+    server = socketserver.ThreadingUnixStreamServer(str(socket_path), _RenderHandler)
+    server.daemon_threads = True
+
+    return server
+
+
+def serve(socket_path: Path) -> None:
+    """Serve render requests on a Unix socket until interrupted.
+
+    Args:
+        socket_path: the path to the socket
+    """
+    server = make_server(socket_path)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+
+
+def _render(path: str, kind: str, options: Any = None) -> str:
+    file_stat = Path(path).stat()
+    return _render_cached(
+        path,
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+        kind,
+        json.dumps(options or {}, sort_keys=True),
+    )
+
+
+@lru_cache(maxsize=256)
+def _render_cached(
+    path: str,
+    mtime_ns: int,  # noqa: ARG001
+    size: int,  # noqa: ARG001
+    kind: str,
+    options: str,
+) -> str:
+    """Render a file, cached until the file is modified."""
+    parsed: Dict[str, Any] = json.loads(options)
+    return render_file(Path(path), kind, parsed)
@@ -1,45 +1,70 @@
 """Utils module."""
 import re
+import sys
+from functools import lru_cache
 from functools import wraps
 from typing import Any
 from typing import Callable
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import TypeVar
 from typing import Union
 
 import numpy as np
-import pyperclip
 from numpy.typing import NDArray
 from typing_extensions import ParamSpec
 
+from .clipboard import copy_to_clipboard
+
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+_SAMPLE_SIZE = 64
+
+# a printf-style number format, e.g. "08.3f", as (width, precision, conversion)
+_NUM_FORMAT = re.compile(r"[-+ #0]*(\d*)(?:\.(\d*))?([a-zA-Z])")
+
+_LATEX_ESCAPES = str.maketrans(
+    {
+        "&": r"\&",
+        "%": r"\%",
+        "$": r"\$",
+        "#": r"\#",
+        "_": r"\_",
+        "{": r"\{",
+        "}": r"\}",
+        "~": r"\textasciitilde{}",
+        "^": r"\textasciicircum{}",
+        "\\": r"\textbackslash{}",
+    }
+)
 
-def use_clipboard(func: Callable[P, T]) -> Callable[P, str]:
+
+def use_clipboard(func: Callable[P, T]) -> Callable[P, T]:
     """Augument decorated functions argument to copy the output to the clipboard."""
 
     @wraps(func)
-    def wrapper_func(*args: P.args, **kwargs: P.kwargs) -> str:
+    def wrapper_func(*args: P.args, **kwargs: P.kwargs) -> T:
         """Wrapped function."""
         out = func(*args, **kwargs)
 
         if kwargs.get("to_clp"):
-            pyperclip.copy(out)
-            print("ArrayTeX: copied to clipboard")
+            text = "\n\n".join(out) if isinstance(out, list) else str(out)
+            copy_to_clipboard(text)
 
-        return str(out)
+        return out
 
     return wrapper_func
 
 
-def _parse_lines(
+def _to_string(
     arr: NDArray[Any],
     num_format: Optional[str] = None,
     scientific_notation: bool = False,
-) -> List[str]:
+) -> str:
     formatter = {}
     if num_format:
 
@@ -52,6 +77,7 @@ def _parse_lines(
         np.array2string(
             arr,
             max_line_width=np.inf,  # type: ignore
+            threshold=sys.maxsize,
             formatter=formatter,  # type: ignore
             separator=" & ",
         )
@@ -60,11 +86,296 @@ def _parse_lines(
         .replace(" &\n", "\n")
     )
 
+    return _replace_e_notation(lines, num_format, scientific_notation)
+
+
+def _replace_e_notation(
+    text: str,
+    num_format: Optional[str] = None,
+    scientific_notation: bool = False,
+) -> str:
     if num_format and "e" in num_format:
         pattern = r"e([\+-]?\d+)"
         replace = r"\\mathrm{e}{\g<1>}"
         if scientific_notation:
             replace = r" \\times 10^{\g<1>}"
-        lines = re.sub(pattern, replace, lines)
+        text = re.sub(pattern, replace, text)
+
+    return text
+
+
+def _parse_lines(
+    arr: NDArray[Any],
+    num_format: Optional[str] = None,
+    scientific_notation: bool = False,
+) -> List[str]:
+    return _to_string(arr, num_format, scientific_notation).splitlines()
+
+
+def _as_stack(arr: NDArray[Any], batch_axis: int = 0) -> NDArray[Any]:
+    """View an N-D array as a 3-D stack of matrices along `batch_axis`.
+
+    `batch_axis` is moved to the front and any other axes apart from the last two are
+    flattened into it.
+    """
+    arr = np.moveaxis(arr, batch_axis, 0)
+    n_batches = int(np.prod(arr.shape[:-2]))
+    return arr.reshape(n_batches, *arr.shape[-2:])
+
+
+def _parse_batches(
+    stack: NDArray[Any],
+    num_format: Optional[str] = None,
+    scientific_notation: bool = False,
+) -> List[List[str]]:
+    """Format a 3-D stack of matrices in a single pass, returning lines per matrix."""
+    if stack.size == 0:
+        return [[] for _ in range(stack.shape[0])]
+
+    blocks = _to_string(stack, num_format, scientific_notation).split("\n\n")
+    return [block.splitlines() for block in blocks]
+
+
+def _format_column(
+    col: NDArray[Any],
+    num_format: Optional[str] = None,
+    scientific_notation: bool = False,
+) -> NDArray[np.str_]:
+    """Format a 1-D array into cell strings with a kernel specialised on its dtype."""
+    if col.size == 0:
+        # some of the kernels don't return strings for empty input
+        return np.empty(col.shape, dtype=str)
+
+    kind = col.dtype.kind
+    if num_format and kind in "iuf":
+        cells = np.char.mod(f"%{num_format}", col)
+    elif kind == "U":
+        cells = col
+    elif kind == "S":
+        cells = np.char.decode(col)
+    else:
+        cells = col.astype(str)
+
+    if num_format and "e" in num_format and kind in "iuf":
+        cells = _replace_e_notation_cells(cells, scientific_notation)
+
+    return cells
+
+
+def _replace_e_notation_cells(
+    cells: NDArray[np.str_], scientific_notation: bool = False
+) -> NDArray[np.str_]:
+    """Replace e-notation cell by cell, as `_replace_e_notation` does for text."""
+    parts = np.char.partition(cells, "e")
+    mantissa, sep, exponent = parts[..., 0], parts[..., 1], parts[..., 2]
+
+    prefix = r" \times 10^{" if scientific_notation else r"\mathrm{e}{"
+    replaced = np.char.add(np.char.add(mantissa, prefix), np.char.add(exponent, "}"))
+
+    return np.where(sep == "e", replaced, cells)
+
+
+def _parse_columns(
+    columns: Sequence[NDArray[Any]],
+    num_formats: Sequence[Optional[str]],
+    scientific_notation: bool = False,
+) -> List[str]:
+    """Format each column independently and interleave them into lines."""
+    rows: Optional[NDArray[np.str_]] = None
+    for col, num_format in zip(columns, num_formats):
+        cells = _format_column(col, num_format, scientific_notation)
+        rows = cells if rows is None else np.char.add(np.char.add(rows, " & "), cells)
+
+    return [] if rows is None else rows.tolist()
+
+
+def _estimate_size(
+    arr: NDArray[Any],
+    num_format: Optional[str] = None,
+    scientific_notation: bool = False,
+) -> int:
+    """Estimate the number of bytes needed for the rows of the formatted `arr`.
+
+    Every cell is assumed to be as wide as the widest cell could be. This is an upper
+    bound for boolean, integer, float and string arrays with the default format or a
+    fixed-point, integer, e-notation or general `num_format`. Object, complex and
+    other arrays are not bounded, their estimate is made from the leading items.
+    """
+    if arr.size == 0:
+        return 0
+
+    kind = arr.dtype.kind
+    width: Optional[int] = None
+    if kind in "iuf" and num_format:
+        width = _e_notation_width(arr, num_format, scientific_notation)
+    elif kind == "f":
+        width = _float_width(arr)
+    elif kind == "U":
+        # quoted, with at most 4 UTF-8 bytes per character
+        width = arr.dtype.itemsize + 2
+    elif kind == "S":
+        # quoted as b'...', with at most 4 characters per escaped byte, e.g. \x00
+        width = 4 * arr.dtype.itemsize + 3
+
+    if width is None:
+        sample = _to_string(_sample(arr), num_format, scientific_notation)
+        cells = sample.strip().split(" & ")
+        width = max(len(cell.encode()) for cell in cells)
+
+    n_rows = arr.size // arr.shape[-1] if arr.ndim else 1
+
+    # each row is "a & b & c \\\n"
+    return arr.size * (width + 3) + n_rows
+
+
+def _estimate_column_size(
+    col: NDArray[Any],
+    num_format: Optional[str] = None,
+    scientific_notation: bool = False,
+) -> int:
+    """Estimate the number of bytes needed for the cells of the formatted `col`.
+
+    As for `_estimate_size`, this is an upper bound for numeric and string columns.
+    """
+    if col.size == 0:
+        return 0
+
+    kind = col.dtype.kind
+    width: Optional[int] = None
+    if kind in "iuf" and num_format:
+        width = _e_notation_width(col, num_format, scientific_notation)
+    elif kind == "f":
+        width = _float_repr_width(col.dtype)
+    elif kind in "US":
+        # at most 4 UTF-8 bytes per character, or 1 byte per decoded byte
+        width = col.dtype.itemsize
+
+    if width is None:
+        cells = _format_column(_sample(col), num_format, scientific_notation)
+        width = max(len(cell.encode()) for cell in cells.tolist())
+
+    # each cell is followed by " & " or " \\"
+    return col.size * (width + 3)
+
+
+def _float_width(arr: NDArray[Any]) -> int:
+    """An upper bound on the width of cells in the default float format.
+
+    numpy switches to e-notation using the largest and smallest magnitudes, and
+    prints at most `precision` digits after the decimal point.
+    """
+    options = np.get_printoptions()
+    precision = options["precision"]
+
+    magnitudes = _magnitudes(arr)
+    if magnitudes.size == 0:
+        # e.g. "-0." or "-inf"
+        return 4
+
+    max_val = float(magnitudes.max())
+    min_val = float(magnitudes.min())
+    use_exp = max_val >= 1e8 or (
+        not options["suppress"] and (min_val < 1e-4 or max_val / min_val > 1e3)
+    )
+
+    if use_exp:
+        # e.g. "-1.23456789e+100"
+        width = 4 + precision + 1 + _exponent_digits(magnitudes)
+    else:
+        # e.g. "-12345678.12345678"
+        width = 1 + len(str(int(max_val))) + 1 + precision
+
+    return max(width, 4)
+
+
+def _float_repr_width(dtype: np.dtype[Any]) -> int:
+    """An upper bound on the width of the shortest repr of floats of `dtype`.
+
+    The repr is positional below 1e16, e.g. "-1234567890123456.0", and otherwise has
+    at most two more digits than `precision` and an exponent.
+    """
+    info = np.finfo(dtype)
+    return max(19, 1 + info.precision + 2 + 3 + len(str(info.maxexp)))
+
+
+def _e_notation_width(
+    arr: NDArray[Any],
+    num_format: str,
+    scientific_notation: bool = False,
+) -> Optional[int]:
+    """An upper bound on the width of cells in an e-notation or general `num_format`.
+
+    Cells have at most a sign, the digits of the precision, a decimal point and an
+    exponent, or for general formats up to four leading zeros. The width of other
+    formats can't be derived from the spec and `None` is returned.
+    """
+    match = _NUM_FORMAT.fullmatch(num_format)
+    if match is None or match.group(3) not in "eEgG":
+        return None
+
+    min_width, precision, conversion = match.groups()
+    digits = 6 if precision is None else int(precision or 0)
+    exponent = 2 + _exponent_digits(_magnitudes(arr))
+    if conversion in "eE":
+        # e.g. "-1.234e+05"
+        width = 1 + digits + 2 + exponent
+    else:
+        # e.g. "-1.234e+05" or "-0.0001234"
+        width = 1 + max(digits, 1) + 1 + max(exponent, 4)
+
+    # e.g. "e+05" becomes "\mathrm{e}{+05}"
+    replaced = len(_replace_e_notation("e+00", num_format, scientific_notation)) - 4
+
+    return max(width, int(min_width or 0)) + replaced
+
+
+def _magnitudes(arr: NDArray[Any]) -> NDArray[Any]:
+    """The finite, non-zero magnitudes of `arr`."""
+    magnitudes = np.abs(arr[np.isfinite(arr)].astype(np.float64))
+    return np.asarray(magnitudes[magnitudes != 0])
+
+
+def _exponent_digits(magnitudes: NDArray[Any]) -> int:
+    """The number of exponent digits needed for `magnitudes` in e-notation.
+
+    The largest magnitude may be rounded up to the next power of ten.
+    """
+    if magnitudes.size == 0:
+        return 2
+
+    exponents = np.floor(np.log10([magnitudes.min(), magnitudes.max()])) + [0, 1]
+    return max(len(str(int(np.abs(exponents).max()))), 2)
+
+
+def _sample(arr: NDArray[Any]) -> NDArray[Any]:
+    """Sample the extremes of numeric arrays, or the leading items of other arrays."""
+    if arr.dtype.kind not in "biuf":
+        return np.asarray(arr.flat[:_SAMPLE_SIZE])
+
+    finite = arr[np.isfinite(arr)]
+    extremes = [finite.min(), finite.max()] if finite.size else []
+    if finite.size < arr.size:
+        # e.g. "-inf" or "nan"
+        extremes.append(-np.inf)
+
+    return np.array(extremes, dtype=arr.dtype)
+
+
+def _escape_labels(labels: Sequence[Any]) -> List[str]:
+    """Escape LaTeX special characters in `labels`.
+
+    The labels are joined and translated in a single pass, then split apart again.
+    """
+    strings = [str(label) for label in labels]
+    text = "\0".join(strings)
+
+    if not strings or text.count("\0") != len(strings) - 1:
+        return [string.translate(_LATEX_ESCAPES) for string in strings]
+
+    return text.translate(_LATEX_ESCAPES).split("\0")
+
 
-    return lines.splitlines()
+@lru_cache(maxsize=128)
+def _escape_header(names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Escape LaTeX special characters in column names, caching repeated headers."""
+    return tuple(_escape_labels(names))
@@ -0,0 +1,24 @@
+"""Shared fixtures."""
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+
+@pytest.fixture()
+def socket_path(tmp_path: Path) -> Iterator[Path]:
+    """Fixture for a render daemon serving on a temporary socket."""
+    # imported here as the server is only available where Unix sockets are
+    from arraytex.server import make_server
+
+    path = tmp_path / "arraytex.sock"
+    server = make_server(path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield path
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
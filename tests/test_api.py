@@ -1,13 +1,25 @@
 """Tests for the main API."""
+import threading
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import Optional
 from unittest import mock
 from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
+from numpy.typing import NDArray
+from pyperclip import PyperclipException
 
+from arraytex import MemoryBackend
+from arraytex import configure_clipboard
+from arraytex import stream_tabular
+from arraytex import to_block_matrix
 from arraytex import to_matrix
 from arraytex import to_tabular
 from arraytex.errors import DimensionMismatchError
+from arraytex.errors import OutputTooLargeError
 from arraytex.errors import TooManyDimensionsError
 
 
@@ -150,19 +162,225 @@ class TestToMatrix:
         )
 
     def test_3_d(self) -> None:
-        """>2 dimensional arrays are handled correctly."""
+        """>2 dimensional arrays are returned as a list of matrices."""
         mat = np.arange(8).reshape(2, 2, 2)
 
-        with pytest.raises(TooManyDimensionsError):
-            to_matrix(mat)
+        out = to_matrix(mat)
+
+        assert out == [
+            r"""\begin{bmatrix}
+0 & 1 \\
+2 & 3 \\
+\end{bmatrix}""",
+            r"""\begin{bmatrix}
+4 & 5 \\
+6 & 7 \\
+\end{bmatrix}""",
+        ]
+
+    def test_separator(self) -> None:
+        """A `separator` joins the matrices of a >2 dimensional array."""
+        mat = np.arange(4).reshape(2, 1, 2)
+
+        out = to_matrix(mat, separator=",\n")
+
+        assert (
+            out
+            == r"""\begin{bmatrix}
+0 & 1 \\
+\end{bmatrix},
+\begin{bmatrix}
+2 & 3 \\
+\end{bmatrix}"""
+        )
+
+    def test_batch_axis(self) -> None:
+        """The batch axis can be chosen."""
+        mat = np.arange(8).reshape(2, 2, 2)
+
+        out = to_matrix(mat, batch_axis=2)
+
+        assert out == [to_matrix(mat[:, :, 0]), to_matrix(mat[:, :, 1])]
+
+    def test_n_d(self) -> None:
+        """Leading axes of N-D arrays are flattened into the batch."""
+        mat = np.arange(24).reshape(2, 3, 2, 2)
+
+        out = to_matrix(mat, num_format=".1f")
+
+        assert len(out) == 6
+        assert out[5] == to_matrix(mat[1, 2], num_format=".1f")
+
+    def test_empty_batch(self) -> None:
+        """An empty batch gives no matrices."""
+        assert to_matrix(np.zeros((0, 2, 2))) == []
+
+    def test_empty_matrices(self) -> None:
+        """Empty matrices in a batch give empty environments."""
+        out = to_matrix(np.zeros((2, 0, 2)))
+
+        assert out == [to_matrix(np.zeros((0, 2)))] * 2
+
+    def test_large(self) -> None:
+        """Large arrays are not summarised."""
+        mat = np.arange(2000).reshape(2, 1000)
+
+        out = to_matrix(mat)
+
+        assert "..." not in out
+        assert "1999 \\\\" in out
+
+
+class TestToBlockMatrix:
+    """Tests for the `to_block_matrix` function."""
+
+    def test_default(self) -> None:
+        """A block matrix is returned with column rules and row separators."""
+        a = np.arange(4).reshape(2, 2)
+        b = np.array([[5], [6]])
+        c = np.array([7, 8])
+        d = np.array(9)
+
+        out = to_block_matrix([[a, b], [c, d]])
+
+        assert (
+            out
+            == r"""\left[\begin{array}{cc|c}
+0 & 1 & 5 \\
+2 & 3 & 6 \\
+\hline
+7 & 8 & 9 \\
+\end{array}\right]"""
+        )
+
+    def test_style(self) -> None:
+        """The delimiters can be changed or removed."""
+        a = np.eye(2, dtype=int)
+
+        out = to_block_matrix([[a, a]], style="", col_align="r")
+
+        assert (
+            out
+            == r"""\begin{array}{rr|rr}
+1 & 0 & 1 & 0 \\
+0 & 1 & 0 & 1 \\
+\end{array}"""
+        )
+
+    def test_num_format(self) -> None:
+        """Number formatting is applied to each block."""
+        a = np.array([[1000.0]])
+
+        out = to_block_matrix(
+            [[a], [a]], style="p", num_format=".1e", scientific_notation=True
+        )
+
+        assert (
+            out
+            == r"""\left(\begin{array}{c}
+1.0 \times 10^{+03} \\
+\hline
+1.0 \times 10^{+03} \\
+\end{array}\right)"""
+        )
+
+    def test_unknown_style(self) -> None:
+        """An error is raised for an unknown style."""
+        with pytest.raises(ValueError, match="Unknown `style`"):
+            to_block_matrix([[np.eye(2)]], style="x")
+
+    def test_no_blocks(self) -> None:
+        """An error is raised if no blocks are supplied."""
+        with pytest.raises(DimensionMismatchError):
+            to_block_matrix([])
+
+    def test_mismatch_block_count(self) -> None:
+        """An error is raised if block rows have different numbers of blocks."""
+        a = np.eye(2)
+
+        with pytest.raises(DimensionMismatchError) as exc:
+            to_block_matrix([[a, a], [a]])
+
+        assert str(exc.value) == (
+            "Number of blocks in row 1 (1) doesn't match number of blocks in row 0 (2)"
+        )
+
+    def test_mismatch_rows(self) -> None:
+        """An error is raised if blocks in a row have different numbers of rows."""
+        with pytest.raises(DimensionMismatchError) as exc:
+            to_block_matrix([[np.eye(2), np.eye(3)]])
+
+        assert str(exc.value) == (
+            "Number of rows in block (0, 1) (3) doesn't match number of rows in "
+            + "block (0, 0) (2)"
+        )
+
+    def test_mismatch_cols(self) -> None:
+        """An error is raised if blocks in a column have different numbers of cols."""
+        with pytest.raises(DimensionMismatchError) as exc:
+            to_block_matrix([[np.eye(2)], [np.ones((1, 3))]])
+
+        assert str(exc.value) == (
+            "Number of columns in block (1, 0) (3) doesn't match number of columns "
+            + "in block (0, 0) (2)"
+        )
+
+    def test_too_many_dimensions(self) -> None:
+        """An error is raised for blocks with more than 2 dimensions."""
+        block = np.arange(8).reshape(2, 2, 2)
+
+        with pytest.raises(TooManyDimensionsError) as exc:
+            to_block_matrix([[block, np.ones((2, 1))]])
+
+        assert str(exc.value) == "Block (0, 0) must have at most 2 dimensions, got 3"
+
+    def test_empty_block_row(self) -> None:
+        """Block rows without any rows are skipped, without a separator."""
+        a = np.arange(4).reshape(2, 2)
+        b = np.array([[5], [6]])
+
+        out = to_block_matrix([[np.zeros((0, 2)), np.zeros((0, 1))], [a, b]])
+
+        assert out == to_block_matrix([[a, b]])
+
+    def test_empty_block_column(self) -> None:
+        """Blocks without any columns contribute no cells."""
+        a = np.arange(4).reshape(2, 2)
+
+        out = to_block_matrix([[a, np.zeros((2, 0))]], style="")
+
+        assert (
+            out
+            == r"""\begin{array}{cc|}
+0 & 1 \\
+2 & 3 \\
+\end{array}"""
+        )
+
+    def test_multiline_cells(self) -> None:
+        """An error is raised if a block's cells don't format to one line per row."""
+        block = np.empty((1, 1), dtype=object)
+        block[0, 0] = np.eye(2)
+
+        with pytest.raises(DimensionMismatchError, match="formatted to 2 lines"):
+            to_block_matrix([[block]])
 
 
 class TestClipboard:
     """Tests for the `to_clp` arg."""
 
-    @mock.patch("arraytex.utils.pyperclip", autospec=True)
+    @pytest.fixture(autouse=True)
+    def backend(self) -> Iterator[MemoryBackend]:
+        """Use an in-process clipboard for the duration of a test."""
+        backend = MemoryBackend()
+        configure_clipboard(backend=backend)
+        yield backend
+        configure_clipboard()
+
+    @mock.patch("arraytex.clipboard.pyperclip", autospec=True)
     def test_success(self, mock_pyperclip: MagicMock) -> None:
-        """Outputs are copied to the clipboard."""
+        """Outputs are copied to the system clipboard by default."""
+        configure_clipboard()
         mat = np.array(1)
 
         to_matrix(mat, to_clp=True)
@@ -171,16 +389,209 @@ class TestClipboard:
             "\\begin{bmatrix}\n1 \\\\\n\\end{bmatrix}"
         )
 
+    def test_backend(self, backend: MemoryBackend) -> None:
+        """A custom backend can be configured."""
+        mat = np.array(1)
+
+        out = to_matrix(mat, to_clp=True)
+
+        assert backend.last == out
+
+    def test_not_copied(self, backend: MemoryBackend) -> None:
+        """Nothing is copied unless requested."""
+        to_matrix(np.array(1))
+
+        assert backend.last is None
+
+    def test_max_bytes(
+        self, backend: MemoryBackend, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Outputs larger than `max_bytes` are not copied and a warning is logged."""
+        configure_clipboard(backend=backend, max_bytes=10)
+
+        to_matrix(np.arange(10), to_clp=True)
+
+        assert backend.last is None
+        assert "exceeds the clipboard limit" in caplog.text
+
+    def test_background(self) -> None:
+        """Outputs can be copied on a background thread."""
+        copied = threading.Event()
+        backend = MagicMock()
+        backend.copy.side_effect = lambda _: copied.set()
+        configure_clipboard(backend=backend, background=True)
+
+        out = to_matrix(np.array(1), to_clp=True)
+
+        assert copied.wait(timeout=5)
+        backend.copy.assert_called_once_with(out)
+
+    def test_copy_failure(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Clipboard failures are logged rather than raised."""
+        backend = MagicMock()
+        backend.copy.side_effect = PyperclipException("no clipboard")
+        configure_clipboard(backend=backend)
+
+        to_matrix(np.array(1), to_clp=True)
+
+        assert "could not copy to clipboard" in caplog.text
+
+
+class TestMaxBytes:
+    """Tests for the `max_bytes` arg."""
+
+    def test_matrix(self) -> None:
+        """Outputs over the budget raise an error with the estimated size."""
+        mat = np.full((3, 3), 1.0)
+        size = len(to_matrix(mat, num_format=".2f", separator="\n"))
+
+        to_matrix(mat, num_format=".2f", separator="\n", max_bytes=size)
+
+        with pytest.raises(OutputTooLargeError) as exc:
+            to_matrix(mat, num_format=".2f", separator="\n", max_bytes=size - 1)
+
+        assert str(exc.value) == (
+            f"Estimated output size ({size} bytes) "
+            + f"exceeds `max_bytes` ({size - 1} bytes)"
+        )
+
+    @pytest.mark.parametrize(
+        ("mat", "num_format"),
+        [
+            (np.random.default_rng(0).standard_normal((20, 20)), ".2f"),
+            (np.random.default_rng(0).standard_normal((20, 20)), ".2e"),
+            (np.array([[9.99e99, -1e-120, np.nan]]), ".1e"),
+            (np.array([[0.0, np.nan]]), ".2e"),
+            (np.array([[1e300, -np.inf]]), ".3f"),
+            (np.full((2, 2), np.nan), ".2f"),
+            (np.linspace(0, 1, 10_000).reshape(100, 100), ".4g"),
+            (np.array([[-5, 1.23456e-7, 5]] * 1000), "g"),
+            (np.array([[1234.5, -0.000123]]), "#10.3G"),
+            (np.arange(-50, 50).reshape(2, 5, 10), "03d"),
+            (np.array(-1), None),
+        ],
+    )
+    @pytest.mark.parametrize("scientific_notation", [False, True])
+    def test_matrix_num_format(
+        self, mat: NDArray[Any], num_format: str, scientific_notation: bool
+    ) -> None:
+        """The estimate is an upper bound for number formats and signed data."""
+        kwargs: Dict[str, Any] = {
+            "num_format": num_format,
+            "scientific_notation": scientific_notation,
+            "separator": "\n",
+        }
+        size = len(to_matrix(mat, **kwargs))
+
+        with pytest.raises(OutputTooLargeError):
+            to_matrix(mat, max_bytes=size - 1, **kwargs)
+
+    def test_tabular(self) -> None:
+        """The budget is applied to tabular outputs."""
+        mat = np.full((3, 3), 1.0)
+        out = to_tabular(mat, num_format=".2f", index=["a", "b", "c"])
+
+        to_tabular(mat, num_format=".2f", index=["a", "b", "c"], max_bytes=len(out))
+
+        with pytest.raises(OutputTooLargeError):
+            to_tabular(mat, num_format=".2f", max_bytes=len(out) // 2)
+
+    def test_block_matrix(self) -> None:
+        """The budget is applied to block matrix outputs."""
+        mat = np.eye(3)
+
+        with pytest.raises(OutputTooLargeError):
+            to_block_matrix([[mat, mat]], max_bytes=64)
+
+    def test_fails_fast(self) -> None:
+        """No formatting is done when the budget is exceeded."""
+        mat = np.zeros((1000, 1000))
+
+        with mock.patch(
+            "arraytex.api._parse_lines"
+        ) as mock_parse_lines, pytest.raises(OutputTooLargeError):
+            to_matrix(mat, max_bytes=1024)
+
+        mock_parse_lines.assert_not_called()
+
+    def test_empty(self) -> None:
+        """Empty arrays don't break the estimate."""
+        to_matrix(np.zeros((0, 3)), max_bytes=1024)
+
+    @pytest.mark.parametrize(
+        "mat",
+        [
+            np.linspace(0, 1, 10_000).reshape(100, 100),
+            np.array([[1e-300, 1e300], [-5.5, np.nan]]),
+            np.array([[9.5e-100, -1.0]]),
+            np.random.default_rng(0).random((20, 20)) * 1e7,
+            np.array([["a" * 10, "é"], ["\n", "b"]]),
+            np.array([[b"\x00\x01", b"ab"]]),
+        ],
+    )
+    def test_upper_bound(self, mat: NDArray[Any]) -> None:
+        """The estimate is an upper bound for default float and string formats."""
+        size = len(str(to_matrix(mat)).encode())
+
+        with pytest.raises(OutputTooLargeError):
+            to_matrix(mat, max_bytes=size - 1)
+
+    def test_object(self) -> None:
+        """Object arrays are estimated from a sample."""
+        mat = np.array([["abc", 1], [None, 2.5]], dtype=object)
+
+        with pytest.raises(OutputTooLargeError):
+            to_matrix(mat, max_bytes=16)
+
+    def test_batch_axis(self) -> None:
+        """Wrappers are counted along the batch axis."""
+        mat = np.arange(12).reshape(1, 3, 4)
+        kwargs: Dict[str, Any] = {"num_format": "03d", "batch_axis": 2, "separator": ""}
+        size = len(to_matrix(mat, **kwargs))
+
+        to_matrix(mat, max_bytes=size, **kwargs)
+
+        with pytest.raises(OutputTooLargeError):
+            to_matrix(mat, max_bytes=size - 1, **kwargs)
+
 
 class TestToTabular:
     """Tests for the `to_tabular` function."""
 
-    def test_too_many_dimensions(self) -> None:
-        """Error is thrown for too many dimensions."""
+    def test_3_d(self) -> None:
+        """>2 dimensional arrays are returned as a list of tables."""
         mat = np.arange(8).reshape(2, 2, 2)
 
-        with pytest.raises(TooManyDimensionsError):
-            to_tabular(mat)
+        out = to_tabular(mat, index=["a", "b"])
+
+        assert out == [
+            to_tabular(mat[0], index=["a", "b"]),
+            to_tabular(mat[1], index=["a", "b"]),
+        ]
+        assert out[1].splitlines()[4] == r"a & 4 & 5 \\"
+
+    def test_3_d_separator(self) -> None:
+        """A `separator` joins the tables of a >2 dimensional array."""
+        mat = np.arange(8).reshape(2, 2, 2)
+
+        out = to_tabular(mat, separator="\n\n")
+
+        assert out == "\n\n".join([str(to_tabular(mat[0])), str(to_tabular(mat[1]))])
+
+    def test_index_not_mutated(self) -> None:
+        """Supplied lists are not modified."""
+        col_names = ["Col 1", "Col 2"]
+        col_align = ["c", "c"]
+
+        to_tabular(
+            np.arange(4).reshape(2, 2),
+            col_names=col_names,
+            col_align=col_align,
+            index=["a", "b"],
+        )
+
+        assert col_names == ["Col 1", "Col 2"]
+        assert col_align == ["c", "c"]
 
     def test_mismatch_col_align(self) -> None:
         """Error is thrown if wrong number of col_align items."""
@@ -409,3 +820,440 @@ Row 2 & 3 & 4 \\
             assert str(exc.value) == (
                 "Number of `col_align` items (2) doesn't match number of columns (3)"
             )
+
+
+class TestStructured:
+    """Tests for structured array support in `to_tabular`."""
+
+    @pytest.fixture()
+    def records(self) -> NDArray[Any]:
+        """A structured array with int, float, string and bytes fields."""
+        return np.array(
+            [(1, 2.5, "a", b"x"), (20, 0.001, "bc", b"y")],
+            dtype=[("id", "i4"), ("val", "f8"), ("name", "U2"), ("tag", "S1")],
+        )
+
+    def test_default(self, records: NDArray[Any]) -> None:
+        """Field names are used as column names."""
+        out = to_tabular(records)
+
+        assert (
+            out
+            == r"""\begin{tabular}{c c c c}
+\toprule
+id & val & name & tag \\
+\midrule
+1 & 2.5 & a & x \\
+20 & 0.001 & bc & y \\
+\bottomrule
+\end{tabular}"""
+        )
+
+    def test_num_format(self, records: NDArray[Any]) -> None:
+        """A single `num_format` applies to all numeric fields."""
+        out = to_tabular(records, num_format=".1f", col_names=["A", "B", "C", "D"])
+
+        assert str(out).splitlines()[2:6] == [
+            r"A & B & C & D \\",
+            r"\midrule",
+            r"1.0 & 2.5 & a & x \\",
+            r"20.0 & 0.0 & bc & y \\",
+        ]
+
+    def test_per_field_format(self, records: NDArray[Any]) -> None:
+        """`num_format` can be given per field."""
+        out = to_tabular(
+            records,
+            num_format={"val": ".1e"},
+            scientific_notation=True,
+            index=["r1", "r2"],
+        )
+
+        assert str(out).splitlines()[4:6] == [
+            r"r1 & 1 & 2.5 \times 10^{+00} & a & x \\",
+            r"r2 & 20 & 1.0 \times 10^{-03} & bc & y \\",
+        ]
+
+    def test_scalar(self, records: NDArray[Any]) -> None:
+        """A single record forms a single row."""
+        out = to_tabular(records[0])
+
+        assert str(out).splitlines()[4] == r"1 & 2.5 & a & x \\"
+
+    def test_e_notation_numeric_only(self) -> None:
+        """E-notation is only replaced in numeric fields."""
+        records = np.array(
+            [(1, 2.5, "e2", b"x"), (20, 0.001, "e-1", b"y")],
+            dtype=[("id", "i4"), ("val", "f8"), ("name", "U3"), ("tag", "S1")],
+        )
+
+        out = to_tabular(records, num_format=".1e")
+
+        assert str(out).splitlines()[4:6] == [
+            r"1.0\mathrm{e}{+00} & 2.5\mathrm{e}{+00} & e2 & x \\",
+            r"2.0\mathrm{e}{+01} & 1.0\mathrm{e}{-03} & e-1 & y \\",
+        ]
+
+    def test_newline_in_field(self) -> None:
+        """String cells containing newlines don't break e-notation replacement."""
+        records = np.array(
+            [(1, 2.5, "a\nb", b"x"), (20, 0.001, "c", b"y")],
+            dtype=[("id", "i4"), ("val", "f8"), ("name", "U3"), ("tag", "S1")],
+        )
+
+        out = to_tabular(records, num_format={"val": ".1e"})
+
+        assert str(out).splitlines()[4:7] == [
+            r"1 & 2.5\mathrm{e}{+00} & a",
+            r"b & x \\",
+            r"20 & 1.0\mathrm{e}{-03} & c & y \\",
+        ]
+
+    def test_bool_field(self) -> None:
+        """`num_format` isn't applied to bool fields, as for plain bool arrays."""
+        records = np.array([(True, 1.5)], dtype=[("b", "?"), ("x", "f8")])
+
+        out = to_tabular(records, num_format=".2f")
+
+        assert str(out).splitlines()[4] == r"True & 1.50 \\"
+        assert to_tabular(np.array([[True]]), num_format=".2f") == to_tabular(
+            np.array([[True]])
+        )
+
+    def test_unknown_format_key(self, records: NDArray[Any]) -> None:
+        """`num_format` keys must name a field."""
+        with pytest.raises(ValueError, match=r"Unknown `num_format` keys \['typo'\]"):
+            to_tabular(records, num_format={"typo": ".2f"})
+
+    def test_max_bytes(self, records: NDArray[Any]) -> None:
+        """The budget is applied to structured arrays, string fields are bounded."""
+        num_format = {"id": "02d", "val": ".3f"}
+        out = to_tabular(records, num_format=num_format)
+
+        to_tabular(records, num_format=num_format, max_bytes=2 * len(out))
+
+        with pytest.raises(OutputTooLargeError):
+            to_tabular(records, num_format=num_format, max_bytes=len(out) - 1)
+
+    @pytest.mark.parametrize("num_format", [None, ".3g"])
+    def test_max_bytes_float_fields(self, num_format: Optional[str]) -> None:
+        """The estimate is an upper bound for float fields."""
+        rng = np.random.default_rng(0)
+        records = np.zeros(50, dtype=[("x", "f8"), ("y", "f4")])
+        records["x"] = rng.standard_normal(50) * 10.0 ** rng.integers(-300, 300, 50)
+        records["y"] = rng.standard_normal(50) / 7
+        out = to_tabular(records, num_format=num_format)
+
+        with pytest.raises(OutputTooLargeError):
+            to_tabular(records, num_format=num_format, max_bytes=len(out) - 1)
+
+    def test_max_bytes_empty(self, records: NDArray[Any]) -> None:
+        """Empty structured arrays only need room for the table."""
+        out = to_tabular(records[:0])
+
+        to_tabular(records[:0], max_bytes=len(out))
+
+    def test_too_many_dimensions(self, records: NDArray[Any]) -> None:
+        """Structured arrays with more than 1 dimension are rejected."""
+        with pytest.raises(TooManyDimensionsError):
+            to_tabular(records.reshape(1, 2))
+
+    @pytest.mark.parametrize(
+        "dtype",
+        [[("id", "i8"), ("v", "f8", (3,))], [("v", "f8", (3,))]],
+    )
+    def test_subarray_field(self, dtype: Any) -> None:
+        """Fields with more than one value per row are rejected."""
+        with pytest.raises(TooManyDimensionsError) as exc:
+            to_tabular(np.zeros(2, dtype=dtype))
+
+        assert str(exc.value) == "Column `v` must have at most 1 dimension, got 2"
+
+    def test_nested_field(self) -> None:
+        """Fields which have fields of their own are rejected."""
+        records = np.zeros(2, dtype=[("id", "i8"), ("n", [("a", "i4"), ("b", "f4")])])
+
+        with pytest.raises(ValueError, match="Column `n` must not have fields"):
+            to_tabular(records)
+
+    def test_mapping_format_unstructured(self) -> None:
+        """A mapping of `num_format` is rejected for unstructured arrays."""
+        with pytest.raises(ValueError, match="requires columnar input"):
+            to_tabular(np.eye(2), num_format={"Col 1": ".2f"})
+
+
+class TestColumnar:
+    """Tests for columnar input to `to_tabular`."""
+
+    def test_sequence(self) -> None:
+        """A sequence of columns keeps the dtype of each column."""
+        out = to_tabular([np.array([1, 2]), np.array([0.5, 1.5]), ["a", "b"]])
+
+        assert (
+            out
+            == r"""\begin{tabular}{c c c}
+\toprule
+Col 1 & Col 2 & Col 3 \\
+\midrule
+1 & 0.5 & a \\
+2 & 1.5 & b \\
+\bottomrule
+\end{tabular}"""
+        )
+
+    def test_mapping(self) -> None:
+        """The keys of a mapping are used as column names."""
+        out = to_tabular(
+            {"n": np.array([1, 2]), "x": np.array([0.25, 0.5])},
+            num_format={"x": ".1f"},
+            index=["a", "b"],
+        )
+
+        assert str(out).splitlines()[2:6] == [
+            r"Index & n & x \\",
+            r"\midrule",
+            r"a & 1 & 0.2 \\",
+            r"b & 2 & 0.5 \\",
+        ]
+
+    def test_format_per_column(self) -> None:
+        """A list of `num_format` items applies one per column."""
+        out = to_tabular(
+            (np.array([1000]), np.array([2])),
+            num_format=[".1e", "03d"],
+            col_names=["A", "B"],
+        )
+
+        assert str(out).splitlines()[4] == r"1.0\mathrm{e}{+03} & 002 \\"
+
+    def test_format_per_column_mismatch(self) -> None:
+        """The number of `num_format` items must match the number of columns."""
+        with pytest.raises(DimensionMismatchError) as exc:
+            to_tabular([np.array([1]), np.array([2])], num_format=[".1f"])
+
+        assert str(exc.value) == (
+            "Number of `num_format` items (1) doesn't match number of columns (2)"
+        )
+
+    def test_length_mismatch(self) -> None:
+        """Columns must have the same length."""
+        with pytest.raises(DimensionMismatchError) as exc:
+            to_tabular([np.array([1, 2]), np.array([3])])
+
+        assert str(exc.value) == (
+            "All columns must have the same number of rows, got [2, 1]"
+        )
+
+    def test_too_many_dimensions(self) -> None:
+        """Columns must have at most 1 dimension."""
+        with pytest.raises(TooManyDimensionsError):
+            to_tabular({"a": np.eye(2)})
+
+    def test_max_bytes(self) -> None:
+        """The budget is applied to columnar input."""
+        columns = {"a": np.arange(10, 20), "b": np.full(10, 0.5)}
+        out = to_tabular(columns, num_format={"b": ".1f"})
+
+        to_tabular(columns, num_format={"b": ".1f"}, max_bytes=len(out))
+
+        with pytest.raises(OutputTooLargeError):
+            to_tabular(columns, max_bytes=len(out) - 1)
+
+
+class TestStreamTabular:
+    """Tests for the `stream_tabular` function."""
+
+    def test_chunks(self) -> None:
+        """The header, blocks of rows and footer are yielded in turn."""
+        rows = ((i, i / 2) for i in range(3))
+
+        out = list(stream_tabular(rows, num_format=[None, ".1f"], batch_size=2))
+
+        assert out == [
+            "\\begin{tabular}{c c}\n\\toprule\nCol 1 & Col 2 \\\\\n\\midrule\n",
+            "0 & 0.0 \\\\\n1 & 0.5 \\\\\n",
+            "2 & 1.0 \\\\\n",
+            "\\bottomrule\n\\end{tabular}",
+        ]
+
+    def test_matches_to_tabular(self) -> None:
+        """Joining the chunks gives the same output as `to_tabular`."""
+        ids = np.arange(5)
+        names = [f"r{i}" for i in range(5)]
+        index = [f"x{i}" for i in range(5)]
+
+        out = stream_tabular(zip(ids.tolist(), names), index=iter(index), batch_size=2)
+
+        assert "".join(out) == to_tabular([ids, names], index=index)
+
+    def test_batches(self) -> None:
+        """2-D and structured arrays are treated as batches of rows."""
+        records = np.array([(1, 0.5), (2, 1.5)], dtype=[("a", "i4"), ("b", "f8")])
+
+        out = "".join(stream_tabular([records, (3, 2.5), np.array([[4, 3.5]])]))
+
+        assert out.splitlines()[2:8] == [
+            r"a & b \\",
+            r"\midrule",
+            r"1 & 0.5 \\",
+            r"2 & 1.5 \\",
+            r"3 & 2.5 \\",
+            r"4.0 & 3.5 \\",
+        ]
+
+    def test_array_rows(self) -> None:
+        """1-D arrays are treated as single rows."""
+        out = "".join(stream_tabular(np.eye(2, dtype=int)))
+
+        assert out.splitlines()[4:6] == [r"1 & 0 \\", r"0 & 1 \\"]
+
+    def test_empty(self) -> None:
+        """An empty iterable gives an empty table."""
+        out = "".join(stream_tabular([], col_names=["a", "b"]))
+
+        assert out.splitlines() == [
+            r"\begin{tabular}{c c}",
+            r"\toprule",
+            r"a & b \\",
+            r"\midrule",
+            r"\bottomrule",
+            r"\end{tabular}",
+        ]
+
+    def test_empty_without_col_names(self) -> None:
+        """An empty iterable requires `col_names`, as there are no columns to name."""
+        with pytest.raises(ValueError, match="`col_names` are required"):
+            list(stream_tabular([]))
+
+    @pytest.mark.parametrize(
+        ("rows", "type_name"),
+        [
+            ([{"a": 1, "b": 2}], "dict"),
+            ([(1, 2), {"a": 3, "b": 4}], "dict"),
+            (["ab", "cd"], "str"),
+        ],
+    )
+    def test_mapping_or_string_rows(self, rows: Any, type_name: str) -> None:
+        """Rows which would iterate as keys or characters are rejected."""
+        with pytest.raises(TypeError) as exc:
+            list(stream_tabular(rows, col_names=["a", "b"]))
+
+        assert str(exc.value) == f"Rows must be sequences of items, got {type_name}"
+
+    def test_row_mismatch(self) -> None:
+        """Rows must have the same number of items."""
+        with pytest.raises(DimensionMismatchError) as exc:
+            list(stream_tabular([(1, 2), (3,)]))
+
+        assert str(exc.value) == (
+            "Number of row items (1) doesn't match number of columns (2)"
+        )
+
+    def test_batch_mismatch(self) -> None:
+        """Batches must have the same number of columns."""
+        with pytest.raises(DimensionMismatchError) as exc:
+            list(stream_tabular([(1, 2), np.eye(3)]))
+
+        assert str(exc.value) == (
+            "Number of batch columns (3) doesn't match number of columns (2)"
+        )
+
+    def test_too_few_index(self) -> None:
+        """An error is raised if `index` runs out."""
+        with pytest.raises(DimensionMismatchError) as exc:
+            list(stream_tabular([(1,), (2,)], index=["a"]))
+
+        assert str(exc.value) == (
+            "Number of `index` items is less than the number of rows"
+        )
+
+    def test_too_many_index(self) -> None:
+        """An error is raised if `index` isn't exhausted."""
+        with pytest.raises(DimensionMismatchError) as exc:
+            list(stream_tabular([(1,), (2,)], index=["a", "b", "c"]))
+
+        assert str(exc.value) == (
+            "Number of `index` items is more than the number of rows (2)"
+        )
+
+
+class TestEscape:
+    """Tests for escaping `col_names` and `index` labels."""
+
+    def test_default(self) -> None:
+        """LaTeX special characters are escaped."""
+        out = to_tabular(
+            np.arange(2).reshape(2, 1),
+            col_names=["Row #", "A & B"],
+            index=["x_1", "50%"],
+        )
+
+        assert str(out).splitlines()[2:6] == [
+            r"Row \# & A \& B \\",
+            r"\midrule",
+            r"x\_1 & 0 \\",
+            r"50\% & 1 \\",
+        ]
+
+    def test_all_characters(self) -> None:
+        """All special characters are escaped."""
+        out = to_tabular(np.array([1]), col_names=["&%$#_{}~^\\"])
+
+        assert str(out).splitlines()[2] == (
+            r"\&\%\$\#\_\{\}\textasciitilde{}\textasciicircum{}\textbackslash{} \\"
+        )
+
+    def test_field_names(self) -> None:
+        """Field names of structured arrays are escaped."""
+        records = np.array([(1, 2)], dtype=[("a_1", "i4"), ("b_2", "i4")])
+
+        out = to_tabular(records)
+
+        assert str(out).splitlines()[2] == r"a\_1 & b\_2 \\"
+
+    def test_null_characters(self) -> None:
+        """Labels containing null characters are escaped."""
+        out = to_tabular(np.arange(2).reshape(2, 1), index=["a\0_", "b"])
+
+        assert str(out).splitlines()[4] == "a\0\\_ & 0 \\\\"
+
+    def test_opt_out(self) -> None:
+        """Escaping can be disabled for labels which are already LaTeX."""
+        out = to_tabular(
+            np.arange(2).reshape(2, 1),
+            col_names=["$x$", "$\\alpha_1$"],
+            index=["$x_1$", "$x_2$"],
+            escape=False,
+        )
+
+        assert str(out).splitlines()[2:6] == [
+            r"$x$ & $\alpha_1$ \\",
+            r"\midrule",
+            r"$x_1$ & 0 \\",
+            r"$x_2$ & 1 \\",
+        ]
+
+    def test_stream(self) -> None:
+        """Labels are escaped when streaming."""
+        out = stream_tabular(
+            [(1,), (2,)], col_names=["#", "a_b"], index=["x_1", "x_2"], batch_size=1
+        )
+
+        assert "".join(out).splitlines()[2:6] == [
+            r"\# & a\_b \\",
+            r"\midrule",
+            r"x\_1 & 1 \\",
+            r"x\_2 & 2 \\",
+        ]
+
+    def test_stream_opt_out(self) -> None:
+        """Escaping can be disabled when streaming."""
+        out = stream_tabular(
+            [(1,)], col_names=["$i$", "a_b"], index=["$x$"], escape=False
+        )
+
+        assert "".join(out).splitlines()[2:5] == [
+            r"$i$ & a_b \\",
+            r"\midrule",
+            r"$x$ & 1 \\",
+        ]
@@ -0,0 +1,151 @@
+"""Tests for the render daemon."""
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from arraytex import to_matrix
+from arraytex import to_tabular
+from arraytex.client import default_socket_path
+from arraytex.client import request_render
+from arraytex.errors import RenderError
+
+
+# the server is imported in the tests, as it's only available where Unix sockets are
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix sockets are unavailable"
+)
+
+
+@pytest.fixture()
+def npy_path(tmp_path: Path) -> Path:
+    """Fixture for an array stored in a `.npy` file."""
+    path = tmp_path / "arr.npy"
+    np.save(path, np.array([[1, 2], [3, 4]]))
+    return path
+
+
+class TestRequestRender:
+    """Tests for rendering through the daemon."""
+
+    def test_matrix(self, socket_path: Path, npy_path: Path) -> None:
+        """The daemon renders the array as `to_matrix` does."""
+        out = request_render(socket_path, npy_path, options={"style": "p"})
+
+        assert out == to_matrix(np.load(npy_path), style="p")
+
+    def test_tabular(self, socket_path: Path, npy_path: Path) -> None:
+        """The daemon renders the array as `to_tabular` does."""
+        out = request_render(socket_path, npy_path, kind="tabular")
+
+        assert out == to_tabular(np.load(npy_path))
+
+    def test_rerenders_modified_file(self, socket_path: Path, npy_path: Path) -> None:
+        """A modified file isn't served from the cache."""
+        first = request_render(socket_path, npy_path)
+        np.save(npy_path, np.array([[5, 6, 7]]))
+
+        second = request_render(socket_path, npy_path)
+
+        assert first != second
+        assert second == to_matrix(np.array([[5, 6, 7]]))
+
+    def test_error(self, socket_path: Path, tmp_path: Path) -> None:
+        """Failures are reported to the client."""
+        with pytest.raises(RenderError, match="FileNotFoundError"):
+            request_render(socket_path, tmp_path / "missing.npy")
+
+    def test_replaces_stale_socket(self, tmp_path: Path) -> None:
+        """A socket left behind by a previous daemon is replaced."""
+        from arraytex.server import make_server
+
+        path = tmp_path / "arraytex.sock"
+        make_server(path).server_close()
+        assert path.exists()
+
+        server = make_server(path)
+        server.server_close()
+
+        assert path.exists()
+
+    def test_refuses_to_replace_live_socket(
+        self, socket_path: Path, npy_path: Path
+    ) -> None:
+        """A socket which a running daemon is listening on isn't replaced."""
+        from arraytex.server import make_server
+
+        with pytest.raises(FileExistsError, match="already serving"):
+            make_server(socket_path)
+
+        assert request_render(socket_path, npy_path) == to_matrix(np.load(npy_path))
+
+    def test_refuses_to_replace_file(self, npy_path: Path) -> None:
+        """Files other than sockets aren't replaced."""
+        from arraytex.server import make_server
+
+        with pytest.raises(FileExistsError):
+            make_server(npy_path)
+
+    def test_closed_without_reply(self, tmp_path: Path, npy_path: Path) -> None:
+        """A daemon which closes the connection without replying is unreachable."""
+        path = tmp_path / "closing.sock"
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(path))
+        listener.listen(1)
+
+        def close_connection() -> None:
+            conn, _ = listener.accept()
+            with conn, conn.makefile("rb") as request_file:
+                request_file.readline()
+
+        thread = threading.Thread(target=close_connection, daemon=True)
+        thread.start()
+
+        with pytest.raises(ConnectionError, match="closed the connection"):
+            request_render(path, npy_path)
+
+        thread.join()
+        listener.close()
+
+
+class TestServe:
+    """Tests for the `serve` function."""
+
+    def test_removes_socket(self, tmp_path: Path) -> None:
+        """The socket is removed when the daemon is interrupted."""
+        from arraytex.server import serve
+
+        path = tmp_path / "arraytex.sock"
+
+        with mock.patch.object(
+            socketserver.ThreadingUnixStreamServer,
+            "serve_forever",
+            side_effect=KeyboardInterrupt,
+        ) as mock_serve_forever:
+            serve(path)
+
+        mock_serve_forever.assert_called_once()
+        assert not path.exists()
+
+
+class TestDefaultSocketPath:
+    """Tests for the `default_socket_path` function."""
+
+    def test_runtime_dir(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The socket is placed in the runtime directory."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+        monkeypatch.setenv("LOGNAME", "ada")
+
+        assert default_socket_path() == Path("/run/user/1000/arraytex-ada.sock")
+
+    def test_temp_dir(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """The temporary directory is used without a runtime directory."""
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setenv("LOGNAME", "ada")
+        monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+
+        assert default_socket_path() == tmp_path / "arraytex-ada.sock"
@@ -0,0 +1,242 @@
+"""Tests for the display module."""
+from typing import Any
+from unittest import mock
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from arraytex import LatexArray
+from arraytex import to_matrix
+from arraytex import to_tabular
+from arraytex.errors import DimensionMismatchError
+from arraytex.utils import _parse_batches
+
+
+class TestLatexArray:
+    """Tests for the `LatexArray` class."""
+
+    def test_matrix(self) -> None:
+        """The output matches `to_matrix`."""
+        mat = np.arange(6).reshape(2, 3)
+
+        out = LatexArray(mat, style="p", num_format=".1f")
+
+        assert str(out) == to_matrix(mat, style="p", num_format=".1f")
+        assert out._repr_latex_() == f"$${out}$$"
+
+    def test_tabular(self) -> None:
+        """The output matches `to_tabular`."""
+        mat = np.arange(6).reshape(2, 3)
+
+        out = LatexArray(mat, kind="tabular", index=["a", "b"])
+
+        assert str(out) == to_tabular(mat, index=["a", "b"])
+        assert out._repr_latex_() == str(out)
+
+    def test_stack(self) -> None:
+        """Arrays with more than 2 dimensions are joined with `separator`."""
+        mat = np.arange(8).reshape(2, 2, 2)
+
+        out = LatexArray(mat, separator=",\n")
+
+        assert str(out) == to_matrix(mat, separator=",\n")
+
+    def test_stack_batch_axis(self) -> None:
+        """The header of stacked tables follows `batch_axis`."""
+        mat = np.arange(12).reshape(2, 2, 3)
+
+        out = LatexArray(mat, kind="tabular", batch_axis=-1)
+
+        assert str(out) == to_tabular(mat, batch_axis=-1, separator="\n")
+
+    def test_unknown_kind(self) -> None:
+        """An error is raised for an unknown kind."""
+        with pytest.raises(ValueError, match="Unknown `kind`"):
+            LatexArray(np.eye(2), kind="table")
+
+    def test_repr(self) -> None:
+        """The repr doesn't render the array."""
+        out = LatexArray(np.eye(2, dtype=int))
+
+        assert repr(out) == "LatexArray(shape=(2, 2), dtype=int64, kind='matrix')"
+
+    def test_lazy(self) -> None:
+        """Nothing is rendered until the output is needed."""
+        with mock.patch("arraytex.display._parse_batches") as mock_parse_batches:
+            LatexArray(np.eye(2))
+
+        mock_parse_batches.assert_not_called()
+
+    def test_memoized(self) -> None:
+        """The output is only rendered again when the array changes."""
+        mat = np.zeros((2, 2))
+        out = LatexArray(mat)
+
+        with mock.patch(
+            "arraytex.display._parse_batches", wraps=_parse_batches
+        ) as mock_render:
+            first = str(out)
+            assert str(out) == first
+            assert mock_render.call_count == 1
+
+            mat[0, 0] = 1
+            assert str(out) != first
+            assert mock_render.call_count == 2
+
+    def test_options_change(self) -> None:
+        """The output is rendered again when the options change."""
+        out = LatexArray(np.ones((2, 2)), kind="tabular", col_names=["a", "b"])
+        str(out)
+
+        out.num_format = ".2f"
+        assert str(out) == to_tabular(np.ones((2, 2)), ".2f", col_names=["a", "b"])
+
+        assert out.col_names is not None
+        out.col_names[0] = "c"
+        assert str(out) == to_tabular(np.ones((2, 2)), ".2f", col_names=["c", "b"])
+
+    def test_object_not_memoized(self) -> None:
+        """Object arrays are rendered every time."""
+        out = LatexArray(np.array([1, "a"], dtype=object))
+
+        with mock.patch(
+            "arraytex.display._parse_batches", wraps=_parse_batches
+        ) as mock_render:
+            str(out)
+            str(out)
+
+        assert mock_render.call_count == 2
+
+    @pytest.mark.parametrize(
+        "mat",
+        [
+            np.array(["2020-01-01"], dtype="M8[D]"),
+            np.zeros((0, 3)),
+            np.zeros((2, 0, 3)),
+        ],
+    )
+    def test_memoized_dtypes(self, mat: NDArray[Any]) -> None:
+        """Arrays without a buffer, or without items, are rendered and memoized."""
+        out = LatexArray(mat)
+
+        with mock.patch(
+            "arraytex.display._parse_batches", wraps=_parse_batches
+        ) as mock_render:
+            assert str(out) == str(out) == to_matrix(mat, separator="\n")
+
+        assert mock_render.call_count == 1
+
+    def test_truncated_matrix(self) -> None:
+        """Large arrays are truncated with dots."""
+        mat = np.arange(100).reshape(10, 10)
+
+        out = LatexArray(mat, max_cells=50, edge_items=2)
+
+        assert (
+            str(out)
+            == r"""\begin{bmatrix}
+0 &  1 & \cdots &  8 &  9 \\
+10 & 11 & \cdots & 18 & 19 \\
+\vdots & \vdots & \ddots & \vdots & \vdots \\
+80 & 81 & \cdots & 88 & 89 \\
+90 & 91 & \cdots & 98 & 99 \\
+\end{bmatrix}"""
+        )
+
+    def test_truncated_tabular(self) -> None:
+        """Column names and index are truncated along with the array."""
+        mat = np.arange(10).reshape(10, 1)
+
+        out = LatexArray(
+            mat,
+            kind="tabular",
+            index=[f"r{i}" for i in range(10)],
+            max_cells=5,
+            edge_items=1,
+        )
+
+        assert (
+            str(out)
+            == r"""\begin{tabular}{l c}
+\toprule
+Index & Col 1 \\
+\midrule
+r0 & 0 \\
+$\vdots$ & $\vdots$ \\
+r9 & 9 \\
+\bottomrule
+\end{tabular}"""
+        )
+
+    def test_truncated_tabular_columns(self) -> None:
+        """Truncated columns are replaced by a column of dots."""
+        mat = np.arange(10).reshape(1, 10)
+
+        out = LatexArray(mat, kind="tabular", max_cells=5, edge_items=1)
+
+        assert str(out).splitlines()[:5] == [
+            r"\begin{tabular}{c c c}",
+            r"\toprule",
+            r"Col 1 & $\cdots$ & Col 10 \\",
+            r"\midrule",
+            r"0 & $\cdots$ & 9 \\",
+        ]
+
+    def test_truncated_stack(self) -> None:
+        """Stacks of matrices are truncated along the batch axis."""
+        mat = np.arange(8).reshape(8, 1, 1)
+
+        out = LatexArray(mat, max_cells=4, edge_items=1, separator=", ")
+
+        assert str(out) == (
+            "\\begin{bmatrix}\n0 \\\\\n\\end{bmatrix}, "
+            + "\\cdots, "
+            + "\\begin{bmatrix}\n7 \\\\\n\\end{bmatrix}"
+        )
+
+    def test_truncated_index_mismatch(self) -> None:
+        """The index is checked against the rows before it's truncated."""
+        mat = np.arange(20).reshape(20, 1)
+
+        out = LatexArray(mat, kind="tabular", index=["x"], max_cells=5, edge_items=2)
+
+        with pytest.raises(DimensionMismatchError) as exc:
+            str(out)
+
+        assert str(exc.value) == (
+            "Number of `index` items (1) doesn't match number of rows (20)"
+        )
+
+    def test_escape(self) -> None:
+        """Visible labels are escaped but the dots aren't."""
+        mat = np.arange(10).reshape(10, 1)
+
+        out = LatexArray(
+            mat,
+            kind="tabular",
+            col_names=["i", "x_i"],
+            index=[f"r_{i}" for i in range(10)],
+            max_cells=5,
+            edge_items=1,
+        )
+
+        assert str(out).splitlines()[2:7] == [
+            r"i & x\_i \\",
+            r"\midrule",
+            r"r\_0 & 0 \\",
+            r"$\vdots$ & $\vdots$ \\",
+            r"r\_9 & 9 \\",
+        ]
+
+    def test_no_escape(self) -> None:
+        """Labels are left as they are with `escape=False`."""
+        mat = np.arange(2).reshape(2, 1)
+
+        out = LatexArray(
+            mat, kind="tabular", col_names=["$x_i$"], index=["$a$", "$b$"], escape=False
+        )
+
+        assert str(out) == to_tabular(
+            mat, col_names=["$x_i$"], index=["$a$", "$b$"], escape=False
+        )
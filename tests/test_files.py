@@ -0,0 +1,169 @@
+"""Tests for the files module."""
+import os
+from pathlib import Path
+from typing import List
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from arraytex import to_matrix
+from arraytex import to_tabular
+from arraytex.files import MANIFEST_NAME
+from arraytex.files import render_dir
+from arraytex.files import render_file
+
+
+@pytest.fixture()
+def directory(tmp_path: Path) -> Path:
+    """Fixture for a directory of arrays stored in `.npy` files."""
+    np.save(tmp_path / "a.npy", np.array([[1, 2], [3, 4]]))
+    (tmp_path / "sub").mkdir()
+    np.save(tmp_path / "sub" / "b.npy", np.array([[1.5, 2.5]]))
+    return tmp_path
+
+
+class TestRenderFile:
+    """Tests for the `render_file` function."""
+
+    def test_kinds(self, directory: Path) -> None:
+        """Arrays are rendered with `to_matrix` or `to_tabular`."""
+        arr = np.load(directory / "a.npy")
+
+        assert render_file(directory / "a.npy") == to_matrix(arr)
+        assert render_file(directory / "a.npy", "tabular") == to_tabular(arr)
+
+    def test_unknown_kind(self, directory: Path) -> None:
+        """An unknown kind is rejected."""
+        with pytest.raises(ValueError, match="Unknown `kind`"):
+            render_file(directory / "a.npy", "table")
+
+
+class TestRenderDir:
+    """Tests for the `render_dir` function."""
+
+    def test_renders_all(self, directory: Path) -> None:
+        """Every array is rendered alongside its `.npy` file on the first call."""
+        written = render_dir(directory, options={"style": "p"})
+
+        assert written == [directory / "a.tex", directory / "sub" / "b.tex"]
+        assert (directory / "a.tex").read_text() == to_matrix(
+            np.load(directory / "a.npy"), style="p"
+        )
+        assert (directory / MANIFEST_NAME).exists()
+
+    def test_unchanged(self, directory: Path) -> None:
+        """Unchanged arrays aren't rendered again."""
+        render_dir(directory)
+
+        assert render_dir(directory) == []
+
+    def test_modified(self, directory: Path) -> None:
+        """Only modified arrays are rendered again."""
+        render_dir(directory)
+        np.save(directory / "a.npy", np.array([[5, 6, 7]]))
+
+        assert render_dir(directory) == [directory / "a.tex"]
+        assert (directory / "a.tex").read_text() == to_matrix(np.array([[5, 6, 7]]))
+
+    def test_touched(self, directory: Path) -> None:
+        """Arrays whose modification time changed but content didn't are skipped."""
+        render_dir(directory)
+        os.utime(directory / "a.npy", ns=(0, 0))
+
+        assert render_dir(directory) == []
+
+    def test_missing_output(self, directory: Path) -> None:
+        """Arrays whose output was removed are rendered again."""
+        render_dir(directory)
+        (directory / "a.tex").unlink()
+
+        assert render_dir(directory) == [directory / "a.tex"]
+
+    def test_options_changed(self, directory: Path) -> None:
+        """All arrays are rendered again when the options change."""
+        render_dir(directory)
+
+        written = render_dir(directory, "tabular")
+
+        assert written == [directory / "a.tex", directory / "sub" / "b.tex"]
+
+    def test_errors(self, directory: Path) -> None:
+        """Arrays which fail to render are reported and retried on the next call."""
+        (directory / "bad.npy").write_bytes(b"not an array")
+        errors: List[Path] = []
+
+        written = render_dir(directory, on_error=lambda path, _: errors.append(path))
+
+        assert written == [directory / "a.tex", directory / "sub" / "b.tex"]
+        assert errors == [directory / "bad.npy"]
+
+        with pytest.raises(ValueError, match="pickled"):
+            render_dir(directory)
+
+    def test_no_temporary_files(self, directory: Path) -> None:
+        """No temporary files are left behind."""
+        render_dir(directory)
+        render_dir(directory, "tabular")
+
+        assert sorted(p.name for p in directory.iterdir()) == [
+            MANIFEST_NAME,
+            "a.npy",
+            "a.tex",
+            "sub",
+        ]
+
+    def test_unknown_kind(self, directory: Path) -> None:
+        """An unknown kind is rejected."""
+        with pytest.raises(ValueError, match="Unknown `kind`"):
+            render_dir(directory, "table")
+
+    @pytest.mark.parametrize(
+        "manifest",
+        [
+            "not json",
+            "[]",
+            '{"version": 0}',
+            '{"version": 1, "kind": "matrix", "options": {}, "files": []}',
+        ],
+    )
+    def test_invalid_manifest(self, directory: Path, manifest: str) -> None:
+        """All arrays are rendered again when the manifest can't be used."""
+        render_dir(directory)
+        (directory / MANIFEST_NAME).write_text(manifest)
+
+        written = render_dir(directory)
+
+        assert written == [directory / "a.tex", directory / "sub" / "b.tex"]
+
+    def test_vanished(self, directory: Path) -> None:
+        """Arrays removed after being listed are reported rather than raised."""
+        errors: List[Path] = []
+        gone = directory / "gone.npy"
+
+        with mock.patch.object(Path, "rglob", return_value=[gone]):
+            written = render_dir(
+                directory, on_error=lambda path, _: errors.append(path)
+            )
+
+        assert written == []
+        assert errors == [gone]
+
+    def test_write_failure(self, directory: Path) -> None:
+        """Failed writes are reported and leave no temporary files behind."""
+        (directory / "a.tex").mkdir()
+        errors: List[Path] = []
+
+        written = render_dir(directory, on_error=lambda path, _: errors.append(path))
+
+        assert written == [directory / "sub" / "b.tex"]
+        assert errors == [directory / "a.npy"]
+        assert not list(directory.glob(".a.tex.*"))
+
+    def test_permissions(self, directory: Path) -> None:
+        """Outputs are written with the default permissions, not the owner's only."""
+        render_dir(directory)
+
+        mode = (directory / "a.tex").stat().st_mode & 0o777
+        (directory / "plain").write_text("")
+        assert mode == (directory / "plain").stat().st_mode & 0o777
@@ -0,0 +1,22 @@
+"""Tests for the package module."""
+import pytest
+
+import arraytex
+
+
+class TestLazyImports:
+    """Tests for the lazily imported public API."""
+
+    def test_exports(self) -> None:
+        """Every name in `__all__` can be imported."""
+        for name in arraytex.__all__:
+            assert getattr(arraytex, name) is not None
+
+    def test_unknown(self) -> None:
+        """Unknown names raise an `AttributeError`."""
+        with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+            arraytex.missing  # noqa: B018
+
+    def test_dir(self) -> None:
+        """The public API is listed before it's imported."""
+        assert set(arraytex.__all__) <= set(dir(arraytex))
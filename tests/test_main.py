@@ -1,8 +1,20 @@
 """Test cases for the __main__ module."""
+import socket
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
 import pytest
 from click.testing import CliRunner
 
 from arraytex import __main__
+from arraytex import to_matrix
+from arraytex import to_tabular
+
+
+unix_sockets = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix sockets are unavailable"
+)
 
 
 @pytest.fixture()
@@ -15,3 +27,159 @@ def test_main_succeeds(runner: CliRunner) -> None:
     """It exits with a status code of zero."""
     result = runner.invoke(__main__.main)
     assert result.exit_code == 0
+
+
+class TestRender:
+    """Tests for the `render` command."""
+
+    @pytest.fixture()
+    def npy_path(self, tmp_path: Path) -> Path:
+        """Fixture for an array stored in a `.npy` file."""
+        path = tmp_path / "arr.npy"
+        np.save(path, np.array([[1.5, 2], [3, 4]]))
+        return path
+
+    def test_matrix(self, runner: CliRunner, npy_path: Path) -> None:
+        """It prints the array as a matrix."""
+        result = runner.invoke(
+            __main__.main, ["render", str(npy_path), "--num-format", ".1f"]
+        )
+
+        assert result.exit_code == 0
+        expected = to_matrix(np.load(npy_path), num_format=".1f")
+        assert result.output == f"{expected}\n"
+
+    def test_tabular(self, runner: CliRunner, npy_path: Path) -> None:
+        """It prints the array as a tabular."""
+        result = runner.invoke(
+            __main__.main, ["render", str(npy_path), "--kind", "tabular"]
+        )
+
+        assert result.exit_code == 0
+        assert result.output == f"{to_tabular(np.load(npy_path))}\n"
+
+    def test_style_with_tabular(self, runner: CliRunner, npy_path: Path) -> None:
+        """It rejects a matrix style for a tabular."""
+        result = runner.invoke(
+            __main__.main,
+            ["render", str(npy_path), "--kind", "tabular", "--style", "p"],
+        )
+
+        assert result.exit_code == 2
+
+    def test_daemon_unavailable(
+        self, runner: CliRunner, npy_path: Path, tmp_path: Path
+    ) -> None:
+        """It renders locally when the daemon can't be reached."""
+        result = runner.invoke(
+            __main__.main,
+            ["render", str(npy_path), "--socket", str(tmp_path / "missing.sock")],
+        )
+
+        assert result.exit_code == 0
+        assert "daemon unavailable" in result.output
+        assert str(to_matrix(np.load(npy_path))) in result.output
+
+    def test_no_unix_sockets(
+        self,
+        runner: CliRunner,
+        npy_path: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """It renders locally where Unix sockets are unavailable, e.g. on Windows."""
+        monkeypatch.delattr(socket, "AF_UNIX", raising=False)
+
+        result = runner.invoke(
+            __main__.main,
+            ["render", str(npy_path), "--socket", str(tmp_path / "arraytex.sock")],
+        )
+
+        assert result.exit_code == 0
+        assert "Unix sockets are unavailable" in result.output
+        assert str(to_matrix(np.load(npy_path))) in result.output
+
+    @unix_sockets
+    def test_daemon(self, runner: CliRunner, npy_path: Path, socket_path: Path) -> None:
+        """It forwards the request to the daemon."""
+        args = ["--style", "p", "--num-format", ".1e", "--scientific-notation"]
+        result = runner.invoke(
+            __main__.main,
+            ["render", str(npy_path), "--socket", str(socket_path), *args],
+        )
+
+        expected = to_matrix(
+            np.load(npy_path), style="p", num_format=".1e", scientific_notation=True
+        )
+        assert result.exit_code == 0
+        assert result.output == f"{expected}\n"
+
+    @unix_sockets
+    def test_daemon_error(
+        self, runner: CliRunner, tmp_path: Path, socket_path: Path
+    ) -> None:
+        """It reports failures from the daemon."""
+        path = tmp_path / "bad.npy"
+        path.write_bytes(b"not an array")
+
+        result = runner.invoke(
+            __main__.main, ["render", str(path), "--socket", str(socket_path)]
+        )
+
+        assert result.exit_code == 1
+        assert "Error: ValueError" in result.output
+
+
+class TestServe:
+    """Tests for the `serve` command."""
+
+    def test_serve(self, runner: CliRunner, tmp_path: Path) -> None:
+        """It serves on the given socket."""
+        path = tmp_path / "arraytex.sock"
+
+        with mock.patch("arraytex.server.serve") as mock_serve:
+            result = runner.invoke(__main__.main, ["serve", "--socket", str(path)])
+
+        assert result.exit_code == 0
+        mock_serve.assert_called_once_with(path)
+
+
+class TestWatch:
+    """Tests for the `watch` command."""
+
+    def test_once(self, runner: CliRunner, tmp_path: Path) -> None:
+        """It renders the arrays in the directory which changed."""
+        np.save(tmp_path / "arr.npy", np.array([[1, 2], [3, 4]]))
+
+        result = runner.invoke(__main__.main, ["watch", str(tmp_path), "--once"])
+
+        assert result.exit_code == 0
+        assert "arr.tex" in result.output
+        expected = to_matrix(np.load(tmp_path / "arr.npy"))
+        assert (tmp_path / "arr.tex").read_text() == expected
+
+        result = runner.invoke(__main__.main, ["watch", str(tmp_path), "--once"])
+
+        assert result.exit_code == 0
+        assert result.output == ""
+
+    def test_errors(self, runner: CliRunner, tmp_path: Path) -> None:
+        """It reports arrays which fail to render and carries on."""
+        (tmp_path / "bad.npy").write_bytes(b"not an array")
+
+        result = runner.invoke(__main__.main, ["watch", str(tmp_path), "--once"])
+
+        assert result.exit_code == 0
+        assert "could not render" in result.output
+
+    def test_interrupted(self, runner: CliRunner, tmp_path: Path) -> None:
+        """It scans until interrupted."""
+        with mock.patch(
+            "arraytex.__main__.time.sleep", side_effect=[None, KeyboardInterrupt]
+        ) as mock_sleep:
+            result = runner.invoke(
+                __main__.main, ["watch", str(tmp_path), "--interval", "0.5"]
+            )
+
+        assert result.exit_code == 0
+        assert mock_sleep.call_args_list == [mock.call(0.5), mock.call(0.5)]
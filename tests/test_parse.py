@@ -0,0 +1,118 @@
+"""Tests for the parse module."""
+import numpy as np
+import pytest
+
+from arraytex import from_matrix
+from arraytex import from_tabular
+from arraytex import to_block_matrix
+from arraytex import to_matrix
+from arraytex import to_tabular
+from arraytex.errors import ParseError
+
+
+class TestFromMatrix:
+    """Tests for the `from_matrix` function."""
+
+    def test_default(self) -> None:
+        """A matrix is parsed back into an array."""
+        mat = np.arange(6).reshape(2, 3)
+
+        out = from_matrix(str(to_matrix(mat, style="p")), dtype=int)
+
+        np.testing.assert_array_equal(out, mat)
+        assert out.dtype == int
+
+    @pytest.mark.parametrize("scientific_notation", [False, True])
+    def test_e_notation(self, scientific_notation: bool) -> None:
+        """E-notation and scientific notation are parsed."""
+        mat = np.array([[1.5e-3, -2.25e4], [3e10, 0.0]])
+
+        out = from_matrix(
+            str(
+                to_matrix(
+                    mat, num_format=".3e", scientific_notation=scientific_notation
+                )
+            )
+        )
+
+        np.testing.assert_array_equal(out, mat)
+
+    def test_default_float_format(self) -> None:
+        """Default float formatting, including non finite values, is parsed."""
+        mat = np.array([[1.0, 0.5], [np.nan, -np.inf]])
+
+        out = from_matrix(str(to_matrix(mat)))
+
+        np.testing.assert_array_equal(out, mat)
+
+    def test_one_d(self) -> None:
+        """One dimensional vectors are parsed as a single row."""
+        out = from_matrix(str(to_matrix(np.array([1, 2, 3]))))
+
+        np.testing.assert_array_equal(out, [[1, 2, 3]])
+
+    def test_block_matrix(self) -> None:
+        """Block matrices are parsed into a single array."""
+        blocks = [[np.eye(2), np.ones((2, 1))], [np.zeros((1, 2)), np.array([[5.0]])]]
+
+        out = from_matrix(to_block_matrix(blocks))
+
+        np.testing.assert_array_equal(out, np.block(blocks))
+
+    def test_not_a_matrix(self) -> None:
+        """An error is raised if there is no environment."""
+        with pytest.raises(ParseError, match="Expected a matrix environment"):
+            from_matrix("1 & 2 \\\\")
+
+    def test_not_numeric(self) -> None:
+        """An error is raised if the cells aren't numbers."""
+        with pytest.raises(ParseError) as exc:
+            from_matrix(str(to_matrix(np.array([["a", "b"]]))))
+
+        assert str(exc.value) == "Expected 1 rows of 2 numbers, found 0 numbers"
+
+    def test_ragged(self) -> None:
+        """An error is raised if rows have different numbers of columns."""
+        text = r"""\begin{bmatrix}
+1 & 2 & 3 \\
+4 \\
+5 & 6 & 7 & 8 & 9 \\
+\end{bmatrix}"""
+
+        with pytest.raises(ParseError) as exc:
+            from_matrix(text)
+
+        assert str(exc.value) == "Expected 3 columns in row 1, found 1"
+
+
+class TestFromTabular:
+    """Tests for the `from_tabular` function."""
+
+    def test_default(self) -> None:
+        """The body of a tabular is parsed back into an array."""
+        mat = np.arange(6).reshape(3, 2) / 4
+
+        out = from_tabular(str(to_tabular(mat, num_format=".2f")))
+
+        np.testing.assert_array_equal(out, mat)
+
+    def test_index(self) -> None:
+        """The index column can be dropped."""
+        mat = np.arange(4).reshape(2, 2)
+
+        out = from_tabular(
+            str(to_tabular(mat, index=["a & b", "c_d"])), dtype=int, index=True
+        )
+
+        np.testing.assert_array_equal(out, mat)
+
+    def test_empty(self) -> None:
+        """A tabular without rows gives an empty array."""
+        out = from_tabular(str(to_tabular(np.zeros((0, 2)))))
+
+        assert out.shape == (0, 0)
+
+    def test_not_a_tabular(self) -> None:
+        """An error is raised if there is no tabular body."""
+        with pytest.raises(ParseError, match="Expected a tabular environment"):
+            from_tabular(str(to_matrix(np.eye(2))))